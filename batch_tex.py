@@ -0,0 +1,159 @@
+# Batch LaTeX compilation: one TeX run per scene instead of one per MathTex.
+#
+# Starting latex + dvisvgm for every expression costs far more than the
+# typesetting itself. This module collects every literal MathTex string in a
+# scene file (see prewarm_tex.collect_tex), typesets all of them as pages of
+# one multi-page standalone document in a single latex run, converts all pages
+# with a single dvisvgm run and drops each page's SVG exactly where Manim
+# would have written it for that expression. The MathTex objects then build
+# from those files as usual, so the result is the same as compiling one by one.
+#
+# Scenes opt in with MATHIATION_BATCH_TEX=1 (install_caches(__file__) runs the
+# batch at import time), or run it by hand:
+#     python batch_tex.py alagebra_17112025.py
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from prewarm_tex import collect_tex
+from scene_index import scene_files
+
+MATH_ENVIRONMENT = "align*"
+
+
+def enabled():
+    return os.environ.get("MATHIATION_BATCH_TEX", "") not in ("", "0")
+
+
+def modified_expression(tex):
+    """The expression exactly as MathTex hands it to LaTeX."""
+    from manim.mobject.text.tex_mobject import SingleStringMathTex
+
+    # The string fix-ups don't read any instance state, so skip __init__
+    return SingleStringMathTex._get_modified_expression(
+        SingleStringMathTex.__new__(SingleStringMathTex), tex
+    )
+
+
+def _split_document(code):
+    head, _, rest = code.partition("\\begin{document}")
+    body, _, _ = rest.partition("\\end{document}")
+    return head, body
+
+
+def _multi_page_preamble(preamble):
+    match = re.search(r"\\documentclass(\[[^\]]*\])?\{standalone\}", preamble)
+    if match is None:
+        return None
+    options = (match.group(1) or "[]")[1:-1]
+    options = f"{options},multi=true" if options else "multi=true"
+    return preamble[:match.start()] + f"\\documentclass[{options}]{{standalone}}" + preamble[match.end():]
+
+
+def _compile_command(tex_template, tex_file, out_dir):
+    compiler = tex_template.tex_compiler
+    command = [compiler, "-interaction=batchmode", "-halt-on-error", f"-output-directory={out_dir}"]
+    if compiler in ("xelatex", "xetex"):
+        command.append("-no-pdf")
+    else:
+        command.append(f"-output-format={tex_template.output_format[1:]}")
+    return command + [str(tex_file)]
+
+
+def batch_compile(expressions, environment=MATH_ENVIRONMENT, tex_template=None):
+    """Typeset ``expressions`` in one TeX run; returns how many SVGs were produced.
+
+    Expressions that already have an SVG in Manim's TeX dir or in the shared
+    TeX cache are skipped. Falls back to nothing (Manim then compiles one by
+    one as usual) if the template isn't standalone-based or the run fails.
+    """
+    from manim import config, logger
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    import tex_cache
+
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    shared = tex_cache.get_cache() if tex_cache.is_installed() else None
+
+    pending = []
+    for tex in expressions:
+        expression = modified_expression(tex)
+        tex_file = generate_tex_file(expression, environment, tex_template)
+        svg_file = tex_file.with_suffix(".svg")
+        key = tex_cache.cache_key(expression, environment, tex_template)
+        if svg_file.exists():
+            continue
+        if shared is not None and shared.contains(key):
+            continue
+        pending.append((tex_file.read_text(encoding="utf-8"), svg_file, key))
+    if not pending:
+        return 0
+
+    preamble = _multi_page_preamble(_split_document(pending[0][0])[0])
+    if preamble is None:
+        logger.info("batch_tex: template is not standalone-based, compiling per expression")
+        return 0
+    pages = "\n".join(
+        f"\\begin{{standalone}}{_split_document(code)[1]}\\end{{standalone}}" for code, _, _ in pending
+    )
+    document = f"{preamble}\\begin{{document}}\n{pages}\n\\end{{document}}\n"
+
+    with tempfile.TemporaryDirectory(prefix="batch_tex_") as work:
+        work = Path(work)
+        tex_file = work / "batch.tex"
+        tex_file.write_text(document, encoding="utf-8")
+        dvi_file = tex_file.with_suffix(tex_template.output_format)
+        start = time.perf_counter()
+        try:
+            subprocess.run(_compile_command(tex_template, tex_file, work), cwd=work,
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.run(
+                ["dvisvgm", *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+                 "--page=1-", "--no-fonts", "--verbosity=0",
+                 f"--output={work / 'page-%4p.svg'}", str(dvi_file)],
+                cwd=work, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        except (OSError, subprocess.CalledProcessError) as exc:
+            logger.warning(f"batch_tex: batch run failed ({exc}), compiling per expression")
+            return 0
+
+        # Each expression's share of the run, so cache stats report real savings
+        seconds = (time.perf_counter() - start) / len(pending)
+
+        produced = 0
+        for page, (_, svg_file, key) in enumerate(pending, start=1):
+            page_svg = work / f"page-{page:04d}.svg"
+            if page_svg.exists():
+                shutil.move(page_svg, svg_file)
+                if shared is not None:
+                    shared.put(key, svg_file, seconds)
+                produced += 1
+    logger.info(f"batch_tex: typeset {produced} expressions in one TeX run")
+    return produced
+
+
+def batch_compile_scene(scene_file):
+    return batch_compile(list(collect_tex([scene_file])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Typeset a scene's MathTex strings in one TeX run.")
+    parser.add_argument("files", nargs="*", help="scene files (default: every scene in the repo)")
+    args = parser.parse_args()
+
+    from cache_setup import install_caches
+
+    install_caches()
+    for path in [Path(f) for f in args.files] or scene_files():
+        print(f"{path.name}: {batch_compile_scene(path)} expressions typeset")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# Opt-in shared render caches for scene files.
+#
+# Call install_caches(__file__) once at the top of a scene file (after the
+# config block). It is idempotent, so batch tools that import several scenes
+# into one process can call it too. With MATHIATION_BATCH_TEX=1 the scene's
+# MathTex strings are also typeset up front in a single TeX run, and with
+# MATHIATION_TEX_FORMAT=1 every compile loads the dumped template preamble.
+# MATHIATION_FRAME_WORKERS=N (or auto) rasterizes long animations on N cores.
+
+import batch_tex
+import frame_pool
+import svg_cache
+import tex_cache
+import tex_format
+import text_cache
+
+
+def install_caches(scene_file=None):
+    tex_cache.install()
+    svg_cache.install()
+    text_cache.install()
+    if tex_format.enabled():
+        tex_format.install()
+    if frame_pool.enabled():
+        frame_pool.install()
+    if scene_file is not None and batch_tex.enabled():
+        batch_tex.batch_compile_scene(scene_file)
@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from cache_setup import install_caches
 
 # TikTok portrait
 config.pixel_width = 1080
@@ -8,6 +10,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class CircleEquationProof(Scene):
     def construct(self):
         # -----------------------------
@@ -85,8 +89,7 @@ class CircleEquationProof(Scene):
         left_padding = 1.2
         right_padding = 0.3
         text_width = config.frame_width - left_padding - right_padding
-        start_y = config.frame_height / 4
-        steps_group = VGroup()
+        scroller = StepScroller(self, max_width=text_width)
 
         # --- stickman function (unchanged) ---
         def create_stickman(center_point):
@@ -110,14 +113,8 @@ class CircleEquationProof(Scene):
             return VGroup(head, body, arm_left, arm_right, leg_left, leg_right)
 
         # --- add_step function with Write animation & stickman ---
-        def add_step(step_mob):
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
-
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_mob = scroller.items[index]
 
             # Add stickman as in original script
             stickman = create_stickman(step_mob.get_bottom() + DOWN*0.4)
@@ -145,10 +142,7 @@ class CircleEquationProof(Scene):
 
             self.remove(stickman, pointer)
 
-            if len(steps_group) > 4:
-                shift_amount = steps_group[-5].height + 0.7
-                self.play(steps_group.animate.shift(UP*shift_amount), run_time=0.5)
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # -----------------------------
@@ -173,8 +167,9 @@ class CircleEquationProof(Scene):
         ]
 
         # Add steps with Write animation
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
         self.wait(1)
         # -----------------------------
         # Final text on a new slide
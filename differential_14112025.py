@@ -1,5 +1,9 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from plotting import adaptive_plot
+from dot_cloud import ScatterMarkers, StaggeredFadeIn
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,6 +12,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class DiffScene(Scene):
     def construct(self):
         # -----------------------------
@@ -37,28 +43,13 @@ class DiffScene(Scene):
         self.play(FadeOut(question_group, shift=DOWN))
 
         # Step group setup
-        steps_group = VGroup()
-        start_y = config.frame_height / 4
-
-        def add_step(step_mob):
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
+        scroller = StepScroller(self, max_width=text_width)
 
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_mob = scroller.items[index]
 
             self.play(Write(step_mob), run_time=1)
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=0.5,
-                    rate_func=smooth
-                )
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # Step-by-step solution
@@ -96,8 +87,9 @@ class DiffScene(Scene):
             ),
         ]
 
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(1.5)
 
@@ -128,12 +120,13 @@ class DiffScene(Scene):
         ).next_to(function_expr, DOWN, buff=0.8)
 
         f = lambda x: (x**3 * np.log(x)) / np.sqrt(1 + x**2)
-        graph = axes.plot(f, color=BLUE, stroke_width=4)
-        points = VGroup(*[Dot(axes.c2p(x, f(x)), radius=0.04, color=YELLOW) for x in np.linspace(0.1, 5, 80)])
+        graph = adaptive_plot(axes, f, color=BLUE, stroke_width=4)
+        xs = np.linspace(0.1, 5, 80)
+        points = ScatterMarkers(axes, xs, f(xs), radius=0.04, color=YELLOW)
 
         self.play(Create(axes), run_time=1.5)
         self.play(Create(graph), run_time=2)
-        self.play(LaggedStartMap(FadeIn, points, shift=UP, lag_ratio=0.05), run_time=2.5)
+        self.play(StaggeredFadeIn(points, shift=UP, lag_ratio=0.05), run_time=2.5)
         self.wait(2)
 
         # -----------------------------
@@ -158,12 +151,12 @@ class DiffScene(Scene):
         ).next_to(derivative_expr, DOWN, buff=0.8)
 
         fp = lambda x: (((3*x**2*np.log(x) + x**2)*(1+x**2) - x**4*np.log(x)) / (1+x**2)**(3/2))
-        graph2 = axes2.plot(fp, color=YELLOW, stroke_width=4)
-        points2 = VGroup(*[Dot(axes2.c2p(x, fp(x)), radius=0.04, color=RED) for x in np.linspace(0.1, 5, 80)])
+        graph2 = adaptive_plot(axes2, fp, color=YELLOW, stroke_width=4)
+        points2 = ScatterMarkers(axes2, xs, fp(xs), radius=0.04, color=RED)
 
         self.play(Create(axes2), run_time=1.5)
         self.play(Create(graph2), run_time=2)
-        self.play(LaggedStartMap(FadeIn, points2, shift=UP, lag_ratio=0.05), run_time=2.5)
+        self.play(StaggeredFadeIn(points2, shift=UP, lag_ratio=0.05), run_time=2.5)
         self.wait(2)
 
         # Closing
@@ -0,0 +1,98 @@
+# Many same-sized dots as a single mobject backed by one NumPy array.
+#
+# A VGroup of Dot mobjects costs one Python object, one move_to and one
+# Cairo path per dot on every frame. DotCloud stores every dot as a subpath
+# of one VMobject: each dot is the same circle outline as Dot, offset by its
+# centre, so moving the whole cloud is one array addition and drawing it is
+# one fill. Updaters compute all new centres at once and call set_positions.
+#
+# Usage:
+#     dots = DotCloud(coords_to_points(axes, xs, ys), radius=0.04, color=YELLOW)
+#     dots.add_updater(lambda mob, dt: mob.set_positions(new_centres(dt)))
+#
+# ScatterMarkers is the variant for dots that need their own opacity and
+# offset (Cairo fills a path with a single opacity): one marker per sample,
+# built from x/y arrays in one batch, with whole-array opacity / offset
+# channels that only rewrite the markers whose value changed. StaggeredFadeIn
+# reveals them as a single animation that eases every marker's progress in one
+# array call, instead of LaggedStartMap(FadeIn, ...) building one animation
+# (and one mobject copy) per dot.
+#
+#     points = ScatterMarkers(axes, xs, f(xs), radius=0.04, color=YELLOW)
+#     self.play(StaggeredFadeIn(points, shift=UP, lag_ratio=0.05), run_time=2.5)
+
+from manim import *
+
+from plotting import coords_to_points
+from stagger import eased, lagged_alphas
+
+
+class DotCloud(VMobject):
+    def __init__(self, positions, radius=DEFAULT_DOT_RADIUS, color=WHITE, **kwargs):
+        super().__init__(fill_color=color, fill_opacity=1.0, stroke_width=0, **kwargs)
+        # One Dot outline centred on the origin, reused for every dot
+        self.template = Dot(ORIGIN, radius=radius).points.copy()
+        self.set_positions(positions)
+
+    def set_positions(self, positions):
+        """Move the dots to ``positions`` (n, 3) in one array operation."""
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        self.set_points((positions[:, None, :] + self.template[None, :, :]).reshape(-1, 3))
+        return self
+
+    def get_positions(self):
+        # Derived from the points so shift / scale / move_to stay in sync; the
+        # Dot outline is rotationally symmetric, so its mean is its centre
+        return self.points.reshape(-1, len(self.template), 3).mean(axis=1)
+
+
+class ScatterMarkers(VGroup):
+    def __init__(self, axes, xs, ys, radius=DEFAULT_DOT_RADIUS, color=WHITE, **kwargs):
+        centres = coords_to_points(axes, xs, ys)
+        outlines = centres[:, None, :] + Dot(ORIGIN, radius=radius).points[None, :, :]
+        markers = []
+        for outline in outlines:
+            marker = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+            marker.set_points(outline)
+            markers.append(marker)
+        super().__init__(*markers, **kwargs)
+        self.opacities = np.ones(len(markers))
+        self.offsets = np.zeros((len(markers), 3))
+
+    def set_marker_opacities(self, opacities):
+        opacities = np.broadcast_to(np.asarray(opacities, dtype=float), self.opacities.shape)
+        # Only markers whose opacity moved need their fill rewritten
+        for i in np.flatnonzero(opacities != self.opacities):
+            self.submobjects[i].set_fill(opacity=opacities[i])
+        self.opacities = opacities.copy()
+        return self
+
+    def set_marker_offsets(self, offsets):
+        """Displace each marker by its row of ``offsets`` from its rest position."""
+        offsets = np.broadcast_to(np.asarray(offsets, dtype=float), self.offsets.shape)
+        delta = offsets - self.offsets
+        for i in np.flatnonzero(np.any(delta != 0, axis=1)):
+            self.submobjects[i].points = self.submobjects[i].points + delta[i]
+        self.offsets = offsets.copy()
+        return self
+
+
+class StaggeredFadeIn(Animation):
+    """LaggedStartMap(FadeIn, markers, shift=..., lag_ratio=...) as one animation."""
+
+    def __init__(self, markers, shift=ORIGIN, lag_ratio=0.05, marker_rate_func=smooth,
+                 rate_func=linear, **kwargs):
+        self.shift_vector = np.asarray(shift, dtype=float)
+        self.lag_ratio_per_marker = lag_ratio
+        self.marker_rate_func = marker_rate_func
+        super().__init__(markers, rate_func=rate_func, introducer=True, **kwargs)
+
+    def begin(self):
+        self.final_opacities = self.mobject.opacities.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        local = lagged_alphas(alpha, len(self.mobject.submobjects), self.lag_ratio_per_marker)
+        progress = eased(self.marker_rate_func, local)
+        self.mobject.set_marker_offsets(np.outer(progress - 1, self.shift_vector))
+        self.mobject.set_marker_opacities(progress * self.final_opacities)
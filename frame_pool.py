@@ -0,0 +1,148 @@
+# Frame-parallel rasterization of a single play() call.
+#
+# The Cairo renderer draws every frame of an animation on one core, although
+# for most animations (Write, Rotate, FadeIn, Transform...) frame i depends
+# only on its time t, not on frame i-1. With this installed, such a play()
+# forks a pool of workers per batch of frames: every child inherits a
+# copy-on-write copy of the scene, moves it to its own frame times and
+# rasterizes into a shared memory buffer, and the parent hands the frames to
+# the file writer in order. Children of the next batch render while the
+# parent encodes the current one. Animations whose frames do depend on the
+# previous one (time-based updaters, wait_until) and short animations are
+# rendered the usual way, so the output is frame-for-frame the same.
+#
+# Scenes pick it up through cache_setup.install_caches() when
+# MATHIATION_FRAME_WORKERS is set to a worker count (or "auto" for one per
+# core). Linux/macOS only (needs fork). Don't combine it with a large
+# render_all.py -j, the two multiply.
+#
+#     MATHIATION_FRAME_WORKERS=auto manim -qh milleniumProblem_28112025.py
+
+import mmap
+import os
+import traceback
+
+import numpy as np
+
+# Frames per child per batch; two batches of frames live in shared memory
+FRAMES_PER_WORKER = 4
+
+_original_play_internal = None
+
+
+def workers():
+    value = os.environ.get("MATHIATION_FRAME_WORKERS", "")
+    if value in ("", "0"):
+        return 0
+    if value == "auto":
+        return os.cpu_count() or 1
+    return int(value)
+
+
+def enabled():
+    return workers() > 1 and hasattr(os, "fork")
+
+
+def _can_parallelize(scene, skip_rendering):
+    from manim import config
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    return (
+        isinstance(scene.renderer, CairoRenderer)
+        and not skip_rendering
+        and not scene.renderer.skip_animations
+        and not getattr(scene, "skip_animation_preview", False)
+        and scene.stop_condition is None
+        # Scene.should_update_mobjects() only works while a Wait is playing
+        and not scene.always_update_mobjects
+        and not scene.updaters
+        and not any(mob.has_time_based_updater() for mob in scene.get_mobject_family_members())
+        and scene.get_run_time(scene.animations) * config.frame_rate >= 2 * workers()
+    )
+
+
+def _fork_batch(scene, times, frames, n_workers):
+    """Start children rendering ``times`` into ``frames``; returns their pids."""
+    renderer = scene.renderer
+    pids = []
+    for slots in np.array_split(np.arange(len(times)), n_workers):
+        if not len(slots):
+            continue
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                for slot in slots:
+                    scene.update_to_time(times[slot])
+                    renderer.update_frame(scene, scene.moving_mobjects)
+                    frames[slot] = renderer.camera.pixel_array
+                status = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                # Skip atexit handlers and buffered writers shared with the parent
+                os._exit(status)
+        pids.append(pid)
+    return pids
+
+
+def _encode_batch(renderer, pids, frames, count):
+    failed = [pid for pid in pids if os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) != 0]
+    if failed:
+        raise RuntimeError(f"{len(failed)} frame worker(s) failed")
+    for slot in range(count):
+        renderer.add_frame(frames[slot])
+
+
+def render_frames(scene, times, n_workers):
+    renderer = scene.renderer
+    shape = renderer.camera.pixel_array.shape
+    batch = n_workers * FRAMES_PER_WORKER
+    buffers = [
+        np.frombuffer(mmap.mmap(-1, batch * int(np.prod(shape))), dtype=np.uint8).reshape(batch, *shape)
+        for _ in range(2)
+    ]
+    pending = None
+    for i, start in enumerate(range(0, len(times), batch)):
+        chunk = times[start:start + batch]
+        frames = buffers[i % 2]
+        pids = _fork_batch(scene, chunk, frames, n_workers)
+        if pending is not None:
+            _encode_batch(renderer, *pending)
+        pending = (pids, frames, len(chunk))
+    if pending is not None:
+        _encode_batch(renderer, *pending)
+
+
+def play_internal(self, skip_rendering=False):
+    """Scene.play_internal, with the frame loop spread over forked workers."""
+    if not _can_parallelize(self, skip_rendering):
+        return _original_play_internal(self, skip_rendering)
+
+    self.duration = self.get_run_time(self.animations)
+    self.time_progression = self._get_animation_time_progression(self.animations, self.duration)
+    times = list(self.time_progression)
+    self.time_progression.close()
+    render_frames(self, times, workers())
+    # Leave the parent's scene where the serial loop would have
+    if times:
+        self.update_to_time(times[-1])
+
+    for animation in self.animations:
+        animation.finish()
+        animation.clean_up_from_scene(self)
+    if not self.renderer.skip_animations:
+        self.update_mobjects(0)
+    self.renderer.static_image = None
+    self.animations = None
+
+
+def install():
+    """Render long animations frame-parallel (idempotent)."""
+    global _original_play_internal
+    from manim import Scene
+
+    if Scene.play_internal is play_internal:
+        return
+    _original_play_internal = Scene.play_internal
+    Scene.play_internal = play_internal
@@ -0,0 +1,168 @@
+# Change-aware re-rendering: only render scenes whose inputs changed.
+#
+# Each scene gets a fingerprint made of the things that decide its video:
+# the scene file's hash (from scene_index), the hashes of the repo helper
+# modules it imports (followed transitively), the TeX template, the render
+# config (quality plus the file's config overrides) and the Manim version.
+# Fingerprints of successful renders are stored next to the videos in
+# <media_dir>/render_fingerprints.json; a scene whose fingerprint matches and
+# whose video still exists is skipped, and everything else is listed with the
+# inputs that changed.
+#
+# Used by render_all.py --incremental:
+#     python render_all.py --incremental
+#     python incremental.py            # just report what would be rebuilt and why
+
+import argparse
+import ast
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+
+from scene_index import REPO_ROOT, build_index, local_imports
+
+STORE_NAME = "render_fingerprints.json"
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def helper_hashes(imports, root=REPO_ROOT):
+    """{helper.py: sha256} for ``imports`` and everything they import from the repo."""
+    hashes = {}
+    pending = list(imports)
+    while pending:
+        name = pending.pop()
+        path = Path(root) / f"{name}.py"
+        if path.name in hashes or not path.exists():
+            continue
+        source = path.read_bytes()
+        hashes[path.name] = _sha256(source)
+        pending.extend(local_imports(ast.parse(source.decode("utf-8")), root))
+    return hashes
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def tex_template_hash():
+    from manim import config
+
+    template = config["tex_template"]
+    return _sha256("\0".join([template.tex_compiler, template.output_format, template.body]).encode("utf-8"))
+
+
+def fingerprint_inputs(entry, quality, tex_hash, version, root=REPO_ROOT):
+    return {
+        "source": entry["sha256"],
+        "helpers": helper_hashes(entry["imports"], root),
+        "tex_template": tex_hash,
+        "config": {"quality": quality, **entry["config"]},
+        "manim": version,
+    }
+
+
+def fingerprint(inputs):
+    return _sha256(json.dumps(inputs, sort_keys=True).encode("utf-8"))
+
+
+def changed_inputs(old, new):
+    """Human-readable list of what differs between two fingerprint input sets."""
+    reasons = []
+    if old["source"] != new["source"]:
+        reasons.append("source changed")
+    helpers = sorted(
+        name for name in set(old["helpers"]) | set(new["helpers"])
+        if old["helpers"].get(name) != new["helpers"].get(name)
+    )
+    if helpers:
+        reasons.append("helpers changed: " + ", ".join(helpers))
+    if old["tex_template"] != new["tex_template"]:
+        reasons.append("TeX template changed")
+    if old["config"] != new["config"]:
+        reasons.append("render config changed")
+    if old["manim"] != new["manim"]:
+        reasons.append(f"Manim {old['manim']} -> {new['manim']}")
+    return reasons
+
+
+class FingerprintStore:
+    def __init__(self, media_dir):
+        self.path = Path(media_dir) / STORE_NAME
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def key(path, scene):
+        return f"{Path(path).name}::{scene}"
+
+    def record(self, path, scene, inputs, output):
+        self.entries[self.key(path, scene)] = {
+            "fingerprint": fingerprint(inputs), "inputs": inputs, "output": output,
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def plan(jobs, quality, store, root=REPO_ROOT):
+    """Split ``jobs`` into what needs rendering and what is up to date.
+
+    Returns (to_render, up_to_date, inputs): to_render maps job -> list of
+    reasons, inputs maps every job -> its fingerprint inputs (to record once
+    the render succeeded).
+    """
+    files = build_index(root)["files"]
+    tex_hash = tex_template_hash()
+    version = manim_version()
+
+    to_render, up_to_date, inputs = {}, [], {}
+    for job in jobs:
+        path, scene = job
+        job_inputs = fingerprint_inputs(files[Path(path).name], quality, tex_hash, version, root)
+        inputs[job] = job_inputs
+        stored = store.entries.get(store.key(path, scene))
+        if stored is None:
+            to_render[job] = ["never rendered"]
+        elif stored["fingerprint"] != fingerprint(job_inputs):
+            to_render[job] = changed_inputs(stored["inputs"], job_inputs)
+        elif not (stored.get("output") and Path(stored["output"]).exists()):
+            to_render[job] = ["output missing"]
+        else:
+            up_to_date.append(job)
+    return to_render, up_to_date, inputs
+
+
+def print_plan(to_render, up_to_date):
+    for path, scene in up_to_date:
+        print(f"  up to date  {Path(path).name}::{scene}")
+    for (path, scene), reasons in to_render.items():
+        print(f"  rebuild     {Path(path).name}::{scene} ({'; '.join(reasons)})")
+    print(f"{len(to_render)} to render, {len(up_to_date)} up to date")
+
+
+def main():
+    from render_all import QUALITIES, discover
+
+    parser = argparse.ArgumentParser(description="Show which scenes need re-rendering and why.")
+    parser.add_argument("files", nargs="*", help="scene files (default: every scene in the repo)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("--media-dir", default="./media")
+    args = parser.parse_args()
+
+    jobs = discover([Path(f) for f in args.files])
+    to_render, up_to_date, _ = plan(jobs, QUALITIES[args.quality], FingerprintStore(args.media_dir))
+    print_plan(to_render, up_to_date)
+
+
+if __name__ == "__main__":
+    main()
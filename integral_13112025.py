@@ -1,5 +1,9 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from plotting import adaptive_plot
+from dot_cloud import ScatterMarkers, StaggeredFadeIn
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,6 +12,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class SinSquareIntegralScene(Scene):
     def construct(self):
         # Padding and text area
@@ -35,30 +41,15 @@ class SinSquareIntegralScene(Scene):
         self.play(FadeOut(question_group, shift=DOWN))
 
         # Step group setup
-        steps_group = VGroup()
-        start_y = config.frame_height / 4  # Start 1/4 vertical height
-
-        def add_step(step_mob):
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
+        scroller = StepScroller(self, max_width=text_width, scroll_time=1.0)
 
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_mob = scroller.items[index]
 
             # Animate step appearance
             self.play(Write(step_mob), run_time=1)
             # Scroll when exceeding 5 visible steps
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=1.0,
-                    rate_func=smooth
-                )
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.8)
 
         # Step-by-step solution
@@ -78,8 +69,9 @@ class SinSquareIntegralScene(Scene):
             MathTex(r"I = \frac{\pi}{2}", font_size=36, color=PURPLE),
         ]
 
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(2)
 
@@ -113,16 +105,17 @@ class SinSquareIntegralScene(Scene):
         ).next_to(integral_expr, DOWN, buff=padding/2)
 
         # Colorful graph and area
-        graph = axes.plot(lambda x: (np.sin(x)**2)/(x**2) if x != 0 else 1, color=BLUE, stroke_width=4)
+        graph = adaptive_plot(axes, lambda x: np.sin(x)**2 / x**2, color=BLUE, stroke_width=4)
         area = axes.get_area(graph, x_range=[0, 20], color=PURPLE, opacity=0.4)
 
         # Animated points for luxury effect
-        points = VGroup(*[Dot(axes.c2p(x, (np.sin(x)**2)/(x**2) if x!=0 else 1), radius=0.04, color=YELLOW) for x in np.linspace(0,20,50)])
+        xs = np.linspace(0, 20, 50)
+        points = ScatterMarkers(axes, xs, np.sinc(xs / np.pi)**2, radius=0.04, color=YELLOW)  # sin²x/x², 1 at x = 0
 
         # Animation sequence
         self.play(Create(axes), run_time=1.5)
         self.play(Create(graph), run_time=2)
-        self.play(LaggedStartMap(FadeIn, points, shift=UP, lag_ratio=0.05), run_time=2.5)
+        self.play(StaggeredFadeIn(points, shift=UP, lag_ratio=0.05), run_time=2.5)
         self.wait(1)
         self.play(FadeIn(area, shift=UP), run_time=2)
 
@@ -1,4 +1,6 @@
 from manim import *
+from step_scroller import StepScroller
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -7,6 +9,8 @@ config.frame_width = 6  # Width in Manim units
 config.frame_height = 6 * (1920 / 1080)  # Maintain aspect ratio
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class LogIntegralScrollingScene(Scene):
     def construct(self):
         # Title (centered vertically, scaled to fit screen width with margin)
@@ -37,32 +41,21 @@ class LogIntegralScrollingScene(Scene):
         self.wait(3)
         self.play(FadeOut(question), FadeOut(integral_expr))
 
-        # Group to hold solution steps
-        steps_group = VGroup()
-        top_margin = 1.0  # Top margin
-        steps_group.shift(DOWN * top_margin)  # initial downward shift
+        # Scroller holding the solution steps, first step pinned to the top edge
+        scroller = StepScroller(
+            self,
+            first_top=config.frame_height / 2 - MED_LARGE_BUFF,
+            scroll_time=1.0
+        )
 
         # Function to add a step with scrolling
-        def add_step(step_mob):
-            steps_group.add(step_mob)
-            # Position below previous step
-            if len(steps_group) == 1:
-                step_mob.to_edge(UP)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_mob = scroller.items[index]
             # Animate step appearing
             self.play(Write(step_mob))
             self.wait(1.5)
-            # Scroll entire group upwards
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                buffer = 0.7
-                shift_amount = prev_step.height + buffer
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=1.0,
-                    rate_func=smooth
-                )
+            # Scroll visible steps upwards
+            scroller.scroll(index)
 
         # Steps of the solution
         steps_list = [
@@ -88,7 +81,9 @@ class LogIntegralScrollingScene(Scene):
         # Add steps with scrolling and left/right margin
         for step in steps_list:
             step.scale_to_fit_width(config.frame_width - 1)  # ensures 0.5 unit margin each side
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         # Wait 3 seconds before celebration
         self.wait(3)
@@ -0,0 +1,43 @@
+# Time-driven motion: one animation that places mobjects from position functions.
+#
+# Instead of stepping positions by hand and calling self.wait() per step
+# (one tiny animation and partial movie each), give every moving mobject a
+# function of time t (seconds since the animation started) and play a single
+# Kinematics animation; Manim renders it as one continuous segment at the
+# output frame rate.
+#
+# bounce() and lorentz_gamma() cover the light clock: a photon bouncing
+# between mirrors at speed c, and the c/γ vertical speed it has in a clock
+# moving at v = βc.
+#
+# Usage:
+#     self.play(Kinematics([
+#         (clock, lambda t: start + RIGHT * v * t),
+#         (photon, lambda t: np.array([x, bounce(t, c, bottom, top), 0])),
+#     ], run_time=5))
+
+from manim import *
+
+
+def lorentz_gamma(beta):
+    return 1 / np.sqrt(1 - beta**2)
+
+
+def bounce(t, speed, low, high):
+    """Position at time t of something moving at ``speed`` between low and high, starting at low."""
+    span = high - low
+    d = (speed * t) % (2 * span)
+    return low + (d if d <= span else 2 * span - d)
+
+
+class Kinematics(Animation):
+    def __init__(self, paths, run_time=1.0, **kwargs):
+        # paths: (mobject, position function of t) pairs
+        self.paths = list(paths)
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(Group(*[mob for mob, _ in self.paths]), run_time=run_time, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = alpha * self.run_time
+        for mob, path in self.paths:
+            mob.move_to(path(t))
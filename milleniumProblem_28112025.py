@@ -1,5 +1,8 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from text_lines import TextLines
+from cache_setup import install_caches
 
 # TikTok portrait
 config.pixel_width = 1080
@@ -8,12 +11,14 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 LEFT_PAD = 1.0
 RIGHT_PAD = 1.0
 TOP_PAD = 1.5
 SAFE_WIDTH = config.frame_width - LEFT_PAD - RIGHT_PAD
 
-class YangMillsMassGap(Scene):
+class YangMillsMassGap(MovingCameraScene):
     def construct(self):
 
         # ===========================
@@ -66,8 +71,7 @@ class YangMillsMassGap(Scene):
         # ===========================
         # Steps (scrollable)
         # ===========================
-        start_y = config.frame_height/4
-        steps_group = VGroup()
+        scroller = StepScroller(self, scroll_time=0.25, mode="camera")
 
         def create_stickman(center_point):
             head_radius = 0.15
@@ -104,21 +108,9 @@ class YangMillsMassGap(Scene):
 
             return VGroup(head, body, arm_left, arm_right, leg_left, leg_right)
 
-        def add_step(step_mob, highlight=False):
-            step_mob.set(width=min(step_mob.width, SAFE_WIDTH))
-
-            if highlight:
-                rect = SurroundingRectangle(step_mob, color=RED, buff=0.12, stroke_width=3)
-                step_group = VGroup(step_mob, rect)
-            else:
-                step_group = step_mob
-
-            steps_group.add(step_group)
-
-            if len(steps_group) == 1:
-                step_group.move_to(UP * start_y)
-            else:
-                step_group.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_group = scroller.items[index]
+            step_mob = steps_list[index]
 
             stickman = create_stickman(step_group.get_bottom() + DOWN * 0.8)
             self.add(stickman)
@@ -140,61 +132,70 @@ class YangMillsMassGap(Scene):
 
             self.remove(stickman, pointer)
 
-            if len(steps_group) > 4:
-                shift_amount = steps_group[-5].height + 0.7
-                self.play(steps_group.animate.shift(UP * shift_amount), run_time=0.25)
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.4)
 
         # ===========================
         # Steps list with MathTex + explanations
         # ===========================
+        lines = TextLines()
         steps_list = [
             MathTex(r"F_{\mu\nu} = \partial_\mu A_\nu - \partial_\nu A_\mu + [A_\mu, A_\nu]", font_size=34, color=BLUE),
-            Text("Yang–Mills field tensor: describes how the field changes in space-time", font_size=26, color=WHITE),
-            Text("F_{μν} = field strength tensor", font_size=26, color=WHITE),
-            Text("A_μ = gauge field (vector potential)", font_size=26, color=WHITE),
-            Text("∂_μ = partial derivative w.r.t spacetime coordinate x^μ", font_size=26, color=WHITE),
-            Text("[A_μ, A_ν] = commutator due to non-abelian nature", font_size=26, color=WHITE),
+            lines("Yang–Mills field tensor: describes how the field changes in space-time", font_size=26, color=WHITE),
+            lines("F_{μν} = field strength tensor", font_size=26, color=WHITE),
+            lines("A_μ = gauge field (vector potential)", font_size=26, color=WHITE),
+            lines("∂_μ = partial derivative w.r.t spacetime coordinate x^μ", font_size=26, color=WHITE),
+            lines("[A_μ, A_ν] = commutator due to non-abelian nature", font_size=26, color=WHITE),
 
             MathTex(r"\mathcal{L} = -\frac{1}{4} \mathrm{Tr} (F_{\mu\nu} F^{\mu\nu})", font_size=32, color=TEAL),
-            Text("Yang–Mills Lagrangian: encodes the dynamics of the fields", font_size=26, color=WHITE),
-            Text("ℒ = Lagrangian density", font_size=26, color=WHITE),
-            Text("Tr = trace over gauge group indices", font_size=26, color=WHITE),
+            lines("Yang–Mills Lagrangian: encodes the dynamics of the fields", font_size=26, color=WHITE),
+            lines("ℒ = Lagrangian density", font_size=26, color=WHITE),
+            lines("Tr = trace over gauge group indices", font_size=26, color=WHITE),
 
             MathTex(r"D^\mu F_{\mu\nu} = 0", font_size=32, color=GREEN),
-            Text("Classical equations of motion for Yang–Mills fields", font_size=26, color=WHITE),
-            Text("D^μ = covariant derivative (includes gauge fields)", font_size=26, color=WHITE),
+            lines("Classical equations of motion for Yang–Mills fields", font_size=26, color=WHITE),
+            lines("D^μ = covariant derivative (includes gauge fields)", font_size=26, color=WHITE),
 
             MathTex(r"\hat{H} |\psi \rangle = E |\psi \rangle", font_size=32, color=ORANGE),
-            Text("Quantum version: Hamiltonian acting on quantum states", font_size=26, color=WHITE),
-            Text("Ĥ = Hamiltonian operator", font_size=26, color=WHITE),
-            Text("|ψ⟩ = quantum state vector", font_size=26, color=WHITE),
-            Text("E = energy eigenvalue", font_size=26, color=WHITE),
+            lines("Quantum version: Hamiltonian acting on quantum states", font_size=26, color=WHITE),
+            lines("Ĥ = Hamiltonian operator", font_size=26, color=WHITE),
+            lines("|ψ⟩ = quantum state vector", font_size=26, color=WHITE),
+            lines("E = energy eigenvalue", font_size=26, color=WHITE),
 
             MathTex(r"\Delta = \min(E > 0) > 0", font_size=36, color=YELLOW),
-            Text("Mass gap: the lowest non-zero energy state has positive mass", font_size=28, color=WHITE),
-            Text("Δ = mass gap (energy difference between ground and first excited state)", font_size=26, color=WHITE),
+            lines("Mass gap: the lowest non-zero energy state has positive mass", font_size=28, color=WHITE),
+            lines("Δ = mass gap (energy difference between ground and first excited state)", font_size=26, color=WHITE),
 
             MathTex(r"\text{Prove existence + } \Delta > 0 \text{ on } \mathbb{R}^{3+1}", font_size=32, color=WHITE),
-            Text("Open problem:", font_size=28, color=WHITE),
-            Text("Mathematically unsolved because:", font_size=28, color=WHITE),
-            Text("• Yang–Mills equations are nonlinear", font_size=28, color=WHITE),
-            Text("• Fields self-interact, making analytic solutions in 4D unknown", font_size=28, color=WHITE),
-            Text("• Lattice simulations suggest a gap exists, but proof is missing", font_size=28, color=WHITE)
+            lines("Open problem:", font_size=28, color=WHITE),
+            lines("Mathematically unsolved because:", font_size=28, color=WHITE),
+            lines("• Yang–Mills equations are nonlinear", font_size=28, color=WHITE),
+            lines("• Fields self-interact, making analytic solutions in 4D unknown", font_size=28, color=WHITE),
+            lines("• Lattice simulations suggest a gap exists, but proof is missing", font_size=28, color=WHITE)
         ]
+        lines.build()
 
         highlight_indices = [0, 6, 10, 13, 18, 21]  # highlight Mass gap and open problem
 
+        step_items = []
         for idx, step in enumerate(steps_list):
             step.set(width=SAFE_WIDTH)
-            add_step(step, highlight=(idx in highlight_indices))
+            if idx in highlight_indices:
+                rect = SurroundingRectangle(step, color=RED, buff=0.12, stroke_width=3)
+                step_items.append(VGroup(step, rect))
+            else:
+                step_items.append(step)
+
+        scroller.layout(step_items)
+        for idx in range(len(steps_list)):
+            add_step(idx)
 
         self.wait(1.0)
 
         # ===========================
         # Gauge Field Rings (Conceptual)
         # ===========================
+        scroller.finish()
         self.clear()
 
         gauge_title = Text(
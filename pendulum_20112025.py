@@ -1,5 +1,11 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from text_lines import TextLines
+from pendulum_motion import PendulumEnsemble, PendulumTrajectory, arc_points
+from dot_cloud import DotCloud
+from plotting import coords_to_points
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,6 +14,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class PendulumTheoremProof(Scene):
     def construct(self):
         # -----------------------------
@@ -43,17 +51,21 @@ class PendulumTheoremProof(Scene):
         # Pendulum diagram with legends and oscillation
         # -----------------------------
         L = 3.0  # pendulum length
+        g = 9.8  # gravity
         theta0 = 30 * DEGREES  # max angle
         pivot = np.array([0, 1.5, 0])
 
         # Explanations of symbols
         top_padding = 1.5
+        lines = TextLines()
         explanations = VGroup(
-            Text("Mass m at the end of a Massless Rod", font_size=28, color=BLUE),
-            Text("Lenght of a Massless Rod: L", font_size=28, color=GREEN),
-            Text("Displaced by an angle θ(t) from the vertical", font_size=28, color=ORANGE),
-            Text("Gravity g acts downward", font_size=28, color=RED)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+            lines("Mass m at the end of a Massless Rod", font_size=28, color=BLUE),
+            lines("Lenght of a Massless Rod: L", font_size=28, color=GREEN),
+            lines("Displaced by an angle θ(t) from the vertical", font_size=28, color=ORANGE),
+            lines("Gravity g acts downward", font_size=28, color=RED)
+        )
+        lines.build()
+        explanations.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         explanations.set_width(text_width)
         explanations.to_edge(UP, buff=top_padding)
         self.play(Write(explanations))
@@ -94,26 +106,24 @@ class PendulumTheoremProof(Scene):
         )
         self.add(pendulum_group)
 
+        # Full nonlinear swing, integrated once; the updater only reads the table
+        motion = PendulumTrajectory.integrate(theta0, g=g, L=L, duration=8)
+        elapsed = 0.0
+
         def pendulum_updater(mob, dt):
-            t = self.renderer.time
-            angle = theta0 * np.cos(np.sqrt(9.8/L) * t)
+            nonlocal elapsed
+            elapsed += dt
+            angle = motion.angle_at(elapsed)
             new_bob = pivot + L * np.array([np.sin(angle), -np.cos(angle), 0])
             mob[0].put_start_and_end_on(pivot, new_bob)
             mob[1].move_to(new_bob)
 
-            # Draw θ from vertical to bob (pivot line as origin)
-            if angle >= 0:  # bob swings right (clockwise)
-                mob[4].become(
-                    Arc(start_angle=-PI/2, angle=angle, radius=0.5, arc_center=pivot, color=BLUE)
-                )
-            else:  # bob swings left (anticlockwise)
-                mob[4].become(
-                    Arc(start_angle=-PI/2, angle=angle, radius=0.5, arc_center=pivot, color=BLUE)
-                )
+            # Draw θ from vertical to bob (pivot line as origin), reusing the arc's points
+            mob[4].points[:] = arc_points(pivot, 0.5, -PI/2, angle)
             mob[5].next_to(mob[4].point_from_proportion(0.5), UP + LEFT*0.05)
             mob[6].move_to((pivot + new_bob)/2 + RIGHT*0.2)
             mob[7].next_to(new_bob, UP + RIGHT*0.1)
-            mob[8].put_start_and_end_on(new_bob, new_bob + DOWN*0.5)
+            mob[8].shift(new_bob - mob[8].get_start())
             mob[9].next_to(mob[8].get_end(), RIGHT*0.1)
 
         pendulum_group.add_updater(pendulum_updater)
@@ -125,8 +135,7 @@ class PendulumTheoremProof(Scene):
         # Step-by-step solution (after pendulum)
         # -----------------------------
         self.clear()
-        steps_group = VGroup()
-        start_y = config.frame_height / 4
+        scroller = StepScroller(self, max_width=text_width, max_visible=3)
 
         def create_stickman(center_point):
             head_radius = 0.15
@@ -143,13 +152,8 @@ class PendulumTheoremProof(Scene):
             leg_right = Line(body_bottom, body_bottom + RIGHT*leg_length + DOWN*0.4, color=YELLOW)
             return VGroup(head, body, arm_left, arm_right, leg_left, leg_right)
 
-        def add_step(step_mob):
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_mob = scroller.items[index]
             stickman = create_stickman(step_mob.get_bottom() + DOWN * 0.4)
             self.add(stickman)
             pointer = Line(
@@ -172,11 +176,7 @@ class PendulumTheoremProof(Scene):
                 UpdateFromAlphaFunc(pointer, lambda mob, a: update_man(mob, step_mob, a))
             )
             self.remove(stickman, pointer)
-            if len(steps_group) > 3:
-                prev_step = steps_group[-4]
-                shift_amt = prev_step.height + 0.7
-                self.play(steps_group.animate.shift(UP * shift_amt), run_time=0.5)
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # -----------------------------
@@ -197,10 +197,51 @@ class PendulumTheoremProof(Scene):
             MathTex(r"\text{T is independent of amplitude } \theta_0", font_size=36, color=GREEN)
         ]
 
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(2)
+
+        # -----------------------------
+        # Phase portrait: where "independent of θ0" breaks down
+        # -----------------------------
+        self.clear()
+        portrait_title = Text("Large swings fall behind", font_size=30, color=YELLOW)
+        portrait_title.to_edge(UP, buff=1.5)
+        omega_max = 1.1 * 2 * np.sqrt(g / L)  # fastest swing, from just under 180°
+        phase_axes = Axes(
+            x_range=[-PI, PI, PI/2],
+            y_range=[-omega_max, omega_max, 1],
+            x_length=text_width,
+            y_length=text_width,
+            axis_config={"color": WHITE},
+            tips=False
+        ).next_to(portrait_title, DOWN, buff=0.8)
+        phase_labels = phase_axes.get_axis_labels(
+            MathTex(r"\theta", font_size=28), MathTex(r"\dot{\theta}", font_size=28)
+        )
+        caption = MathTex(
+            r"\text{Small } \theta_0 \text{: one line, same period}",
+            font_size=30, color=GREEN
+        ).next_to(phase_axes, DOWN, buff=0.6)
+
+        # Thousands of pendulums released from rest, one amplitude each
+        ensemble = PendulumEnsemble(np.linspace(-170, 170, 2000) * DEGREES, g=g, L=L)
+        cloud = DotCloud(coords_to_points(phase_axes, ensemble.theta, ensemble.omega), radius=0.015, color=YELLOW)
+
+        self.play(Write(portrait_title), Create(phase_axes), Write(phase_labels), run_time=1.5)
+        self.play(FadeIn(cloud), Write(caption))
+
+        def ensemble_updater(mob, dt):
+            ensemble.advance(dt)
+            mob.set_positions(coords_to_points(phase_axes, ensemble.theta, ensemble.omega))
+
+        cloud.add_updater(ensemble_updater)
+        self.wait(6)
+        cloud.remove_updater(ensemble_updater)
+        self.wait(1)
+
         # -----------------------------
         # Closing text (vertically centered)
         # -----------------------------
@@ -0,0 +1,115 @@
+# Nonlinear pendulum motion, integrated once and played back from a table.
+#
+# θ'' + (g/L) sin θ = 0 is integrated before playback with a symplectic
+# (velocity Verlet / leapfrog) step, which keeps the energy bounded so large
+# swings (150°) neither gain nor lose amplitude over a scene. The samples go
+# into a lookup table on a fixed time step; updaters only interpolate it and
+# move existing points (arc_points writes an Arc's bezier points in place), so
+# a frame allocates no mobjects.
+#
+# leapfrog_step works on arrays of any shape, so PendulumEnsemble advances
+# thousands of pendulums as one (2, n) state array with the same call, e.g.
+# for a phase portrait drawn as a single DotCloud.
+#
+# Usage:
+#     motion = PendulumTrajectory.integrate(theta0=150 * DEGREES, g=9.8, L=3.0, duration=8)
+#     angle = motion.angle_at(elapsed)
+#     angle_arc.points[:] = arc_points(pivot, 0.5, -PI / 2, angle)
+#
+#     ensemble = PendulumEnsemble(np.linspace(-170, 170, 2000) * DEGREES, g=9.8, L=3.0)
+#     ensemble.advance(dt)  # ensemble.theta, ensemble.omega are (n,) views
+
+import numpy as np
+
+TABLE_STEP = 1 / 600  # seconds between stored samples
+SUBSTEPS = 8  # integration steps per stored sample
+
+
+def leapfrog_step(theta, omega, dt, g_over_L):
+    """One velocity Verlet step of θ'' = -(g/L) sin θ; arrays update elementwise."""
+    omega_half = omega - 0.5 * dt * g_over_L * np.sin(theta)
+    theta = theta + dt * omega_half
+    omega = omega_half - 0.5 * dt * g_over_L * np.sin(theta)
+    return theta, omega
+
+
+class PendulumTrajectory:
+    def __init__(self, step, theta, omega):
+        self.step = step
+        self.theta = theta
+        self.omega = omega
+
+    @classmethod
+    def integrate(cls, theta0, omega0=0.0, g=9.8, L=1.0, duration=10.0,
+                  step=TABLE_STEP, substeps=SUBSTEPS):
+        samples = int(np.ceil(duration / step)) + 1
+        theta = np.empty(samples)
+        omega = np.empty(samples)
+        theta[0], omega[0] = theta0, omega0
+        dt = step / substeps
+        th, om = float(theta0), float(omega0)
+        for i in range(1, samples):
+            for _ in range(substeps):
+                th, om = leapfrog_step(th, om, dt, g / L)
+            theta[i], omega[i] = th, om
+        return cls(step, theta, omega)
+
+    @property
+    def duration(self):
+        return (len(self.theta) - 1) * self.step
+
+    def _lookup(self, table, t):
+        # Past the end the table holds its last sample
+        position = np.clip(t / self.step, 0, len(table) - 1)
+        i = int(min(position, len(table) - 2))
+        w = position - i
+        return (1 - w) * table[i] + w * table[i + 1]
+
+    def angle_at(self, t):
+        return self._lookup(self.theta, t)
+
+    def velocity_at(self, t):
+        return self._lookup(self.omega, t)
+
+
+class PendulumEnsemble:
+    def __init__(self, theta0, omega0=0.0, g=9.8, L=1.0, max_step=TABLE_STEP / SUBSTEPS):
+        theta0 = np.asarray(theta0, dtype=float)
+        self.state = np.empty((2, theta0.size))
+        self.state[0] = theta0.ravel()
+        self.state[1] = np.broadcast_to(omega0, theta0.shape).ravel()
+        self.g_over_L = g / L
+        self.max_step = max_step
+        self.time = 0.0
+
+    @property
+    def theta(self):
+        return self.state[0]
+
+    @property
+    def omega(self):
+        return self.state[1]
+
+    def advance(self, dt):
+        """Move every pendulum forward by ``dt`` seconds in max_step-sized steps."""
+        if dt <= 0:
+            return self
+        steps = int(np.ceil(dt / self.max_step))
+        theta, omega = self.state
+        for _ in range(steps):
+            theta, omega = leapfrog_step(theta, omega, dt / steps, self.g_over_L)
+        self.state[0], self.state[1] = theta, omega
+        self.time += dt
+        return self
+
+
+def arc_points(center, radius, start_angle, angle, num_components=9):
+    """Bezier points of Arc(start_angle, angle, radius, arc_center=center), as Arc builds them."""
+    angles = np.linspace(start_angle, start_angle + angle, num_components)
+    anchors = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+    tangents = np.stack([-anchors[:, 1], anchors[:, 0], np.zeros_like(angles)], axis=1)
+    d_theta = angle / (num_components - 1)
+    handles1 = anchors[:-1] + (d_theta / 3) * tangents[:-1]
+    handles2 = anchors[1:] - (d_theta / 3) * tangents[1:]
+    points = np.stack([anchors[:-1], handles1, handles2, anchors[1:]], axis=1).reshape(-1, 3)
+    return radius * points + np.asarray(center)
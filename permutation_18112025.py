@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,7 +10,9 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
-class TrigInfiniteCycle(Scene):
+install_caches(__file__)
+
+class TrigInfiniteCycle(MovingCameraScene):
     def construct(self):
         # -----------------------------
         # Step-by-step solution
@@ -44,8 +48,7 @@ class TrigInfiniteCycle(Scene):
         self.play(FadeOut(question, shift=DOWN))
 
         # Step-by-step solution
-        steps_group = VGroup()
-        start_y = config.frame_height / 4
+        scroller = StepScroller(self, max_width=text_width, mode="camera")
 
         def create_stickman(center_point, gender="male"):
             """Create a realistic stickman with optional dress for female."""
@@ -91,15 +94,9 @@ class TrigInfiniteCycle(Scene):
 
             return stickman
 
-        def add_step(step_mob, gender="male"):
+        def add_step(index, gender="male"):
             """Add a step with stickman appearing below the step, then disappearing."""
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
-
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+            step_mob = scroller.items[index]
 
             stickman = create_stickman(step_mob.get_bottom() + DOWN * 0.4, gender=gender)
             self.add(stickman)
@@ -123,15 +120,7 @@ class TrigInfiniteCycle(Scene):
 
             self.remove(stickman, pointer)
 
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=0.5,
-                    rate_func=smooth
-                )
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # Steps content
@@ -158,12 +147,14 @@ class TrigInfiniteCycle(Scene):
             MathTex(r"\text{complement principle}", font_size=36, color=GREEN)
         ]
 
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(1.5)
 
         # Closing
+        scroller.finish()
         self.clear()
         final_text = Text("Nailed it!", font_size=40, color=YELLOW)
         final_text.move_to(ORIGIN)
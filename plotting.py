@@ -0,0 +1,172 @@
+# Vectorized plotting helpers for functions with poles (tan, csc, 1/x, ...).
+#
+# The function is evaluated over the whole x grid in one NumPy call, points
+# that are non-finite or beyond the clip threshold are found with an array
+# mask, the remaining runs become separate curves, and all graph coordinates
+# are mapped to scene points in one batched transform instead of one
+# axes.c2p call per sample. The grid step is just an argument, so a denser
+# curve costs almost nothing extra.
+#
+# adaptive_plot is the axes.plot counterpart for smooth graphs with blow-ups
+# or removable holes: instead of a fixed step it bisects only where the curve
+# is still further than a tolerance from its chords, fills 0/0 holes and
+# splits at poles.
+#
+# Usage:
+#     graph = segmented_plot(axes, np.tan, -4 * np.pi, 4 * np.pi, threshold=2)
+#     graph = adaptive_plot(axes, lambda x: np.sin(x)**2 / x**2, color=BLUE)
+#     self.play(Create(graph))
+
+from manim import *
+from manim.mobject.graphing.scale import LinearBase
+
+
+def coords_to_points(axes, xs, ys):
+    """Batched axes.c2p: scene points (n, 3) for graph coordinates xs, ys."""
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if not (isinstance(axes.x_axis.scaling, LinearBase) and isinstance(axes.y_axis.scaling, LinearBase)):
+        # Log axes aren't affine; map point by point
+        return np.array([axes.c2p(x, y) for x, y in zip(xs, ys)]).reshape(-1, 3)
+    # Linear axes are an affine map: origin plus one basis vector per axis
+    origin = np.array(axes.c2p(0, 0))
+    x_unit = np.array(axes.c2p(1, 0)) - origin
+    y_unit = np.array(axes.c2p(0, 1)) - origin
+    return origin + xs[:, None] * x_unit + ys[:, None] * y_unit
+
+
+def evaluate(fn, xs):
+    """fn over the whole grid at once; poles come back as inf/nan, not warnings."""
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        try:
+            ys = fn(xs)
+        except (TypeError, ValueError):
+            # Scalar-only function (``if x != 0`` guards and the like)
+            ys = [fn(x) for x in xs]
+    return np.broadcast_to(np.asarray(ys, dtype=float), xs.shape)
+
+
+def true_runs(mask):
+    """(start, stop) index pairs of every run of True in ``mask``."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1))
+
+
+def segmented_plot(axes, fn, x_min, x_max, threshold=2, step=0.005, color=BLUE, stroke_width=3):
+    """Plot ``fn`` as one curve per run of finite samples with |y| <= threshold."""
+    xs = np.arange(x_min, x_max, step)
+    ys = evaluate(fn, xs)
+    keep = np.isfinite(ys) & (np.abs(ys) <= threshold)
+    points = coords_to_points(axes, xs, np.where(keep, ys, 0.0))
+
+    group = VGroup()
+    for start, stop in true_runs(keep):
+        if stop - start < 2:
+            continue
+        curve = VMobject()
+        curve.set_points_as_corners(points[start:stop])
+        curve.set_stroke(color=color, width=stroke_width)
+        group.add(curve)
+    return group
+
+
+def _fill_removable(fn, xs, ys, width):
+    """Replace nan/inf samples whose two close neighbours agree (0/0 style holes)."""
+    bad = ~np.isfinite(ys)
+    if not bad.any():
+        return ys
+    h = width * 1e-9
+    left = evaluate(fn, xs[bad] - h)
+    right = evaluate(fn, xs[bad] + h)
+    removable = np.isfinite(left) & np.isfinite(right) & (np.abs(left - right) <= 1e-6 * (1 + np.abs(left)))
+    ys = ys.copy()
+    ys[np.flatnonzero(bad)[removable]] = ((left + right) / 2)[removable]
+    return ys
+
+
+def adaptive_segments(axes, fn, x_min, x_max, tolerance=0.01, initial_samples=32, max_depth=12, threshold=None):
+    """Sample ``fn`` densely only where the curve bends; one (n, 3) array per segment.
+
+    Every pass bisects, in one batched evaluation, the intervals whose midpoint
+    lies more than ``tolerance`` scene units off the chord, so straight stretches
+    stay at a handful of vertices. Removable holes (sin(x)/x at 0) are filled
+    from their neighbours; non-finite values and values further than
+    ``threshold`` from zero (default: one y-axis span beyond the axes) are
+    treated as poles and split the curve.
+    """
+    if threshold is None:
+        y_min, y_max = axes.y_range[:2]
+        threshold = max(abs(y_min), abs(y_max)) + (y_max - y_min)
+
+    def visible(y):
+        return np.isfinite(y) & (np.abs(y) <= threshold)
+
+    width = x_max - x_min
+    xs = np.linspace(x_min, x_max, initial_samples + 1)
+    ys = _fill_removable(fn, xs, evaluate(fn, xs), width)
+    points = coords_to_points(axes, xs, ys)
+    active = np.ones(len(xs) - 1, dtype=bool)
+
+    for _ in range(max_depth):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        mid_x = (xs[idx] + xs[idx + 1]) / 2
+        mid_y = _fill_removable(fn, mid_x, evaluate(fn, mid_x), width)
+        mid_points = coords_to_points(axes, mid_x, mid_y)
+        with np.errstate(invalid="ignore"):
+            error = np.linalg.norm(mid_points - (points[idx] + points[idx + 1]) / 2, axis=1)
+        # nan (pole nearby) refines too, unless the whole interval is off-screen
+        refine = ~(error <= tolerance) & (visible(ys[idx]) | visible(ys[idx + 1]) | visible(mid_y))
+
+        split = idx[refine] + 1
+        xs = np.insert(xs, split, mid_x[refine])
+        ys = np.insert(ys, split, mid_y[refine])
+        points = np.insert(points, split, mid_points[refine], axis=0)
+        # Both halves of a refined interval are looked at again next pass
+        inserted = split + np.arange(len(split))
+        active = np.zeros(len(xs) - 1, dtype=bool)
+        active[inserted - 1] = True
+        active[inserted[inserted < len(active)]] = True
+
+    keep = visible(ys)
+    return [points[start:stop] for start, stop in true_runs(keep) if stop - start >= 2]
+
+
+class AdaptiveGraph(ParametricFunction):
+    """Drop-in for axes.plot(fn) that samples adaptively (see adaptive_segments).
+
+    Works with axes.get_area / i2gp like a regular graph. ``fn`` is evaluated on
+    arrays; scalar-only functions still work, just without the batching.
+    """
+
+    def __init__(self, axes, fn, x_range=None, tolerance=0.01, initial_samples=32,
+                 max_depth=12, threshold=None, **kwargs):
+        x_min, x_max = axes.x_range[:2] if x_range is None else x_range[:2]
+        self.axes = axes
+        self.tolerance = tolerance
+        self.initial_samples = initial_samples
+        self.max_depth = max_depth
+        self.threshold = threshold
+        self.underlying_function = fn
+        super().__init__(lambda t: axes.c2p(t, self.value_at(t)), t_range=(x_min, x_max), **kwargs)
+
+    def value_at(self, x):
+        xs = np.array([x], dtype=float)
+        ys = _fill_removable(self.underlying_function, xs, evaluate(self.underlying_function, xs),
+                             self.t_max - self.t_min)
+        return ys[0]
+
+    def generate_points(self):
+        for segment in adaptive_segments(self.axes, self.underlying_function, self.t_min, self.t_max,
+                                         self.tolerance, self.initial_samples, self.max_depth,
+                                         self.threshold):
+            self.start_new_path(segment[0])
+            self.add_points_as_corners(segment[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+
+def adaptive_plot(axes, fn, x_range=None, **kwargs):
+    return AdaptiveGraph(axes, fn, x_range=x_range, **kwargs)
@@ -0,0 +1,103 @@
+# Ahead-of-time TeX prewarm for every scene in the repo.
+#
+# Scans the scene files without importing them (importing runs
+# `from manim import *` and rewrites the global config), collects every
+# literal MathTex string together with the files it appears in, then
+# typesets the unique strings in a process pool (font_size only scales the
+# mobject, it doesn't change the TeX source). The SVGs land in the shared
+# TeX cache (see tex_cache.py) as well as Manim's own media/Tex, so the next
+# render starts with zero LaTeX compiles.
+#
+# Usage:
+#     python prewarm_tex.py                   # every scene file in the repo
+#     python prewarm_tex.py tesaract.py -j 8  # selected files, 8 workers
+
+import argparse
+import ast
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from scene_index import scene_files
+
+TEX_CLASSES = {"MathTex"}
+
+
+def collect_tex(paths):
+    """Return {tex_string: set of file names} for all literal MathTex calls.
+
+    Strings built at runtime (f-strings, concatenation with variables) can't
+    be known statically and are skipped; they compile on first render as usual.
+    """
+    found = {}
+    for path in paths:
+        path = Path(path)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                    and node.func.id in TEX_CLASSES):
+                continue
+            parts = [a.value for a in node.args if isinstance(a, ast.Constant) and isinstance(a.value, str)]
+            if not parts or len(parts) != len(node.args):
+                continue
+            # MathTex joins its arguments with a single space before compiling
+            tex = " ".join(parts)
+            found.setdefault(tex, set()).add(path.name)
+    return found
+
+
+def _init_worker(media_dir):
+    from manim import config
+    from cache_setup import install_caches
+
+    config.media_dir = media_dir
+    install_caches()
+
+
+def _typeset(tex):
+    from manim import MathTex
+    start = time.perf_counter()
+    MathTex(tex)
+    return tex, time.perf_counter() - start
+
+
+def prewarm(paths, workers=None, media_dir="./media"):
+    """Typeset every collected MathTex string into the TeX cache; returns the failures."""
+    found = collect_tex(paths)
+    workers = workers or os.cpu_count() or 1
+    print(f"Prewarming {len(found)} TeX strings from {len(paths)} files with {workers} workers")
+
+    failures = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(media_dir,)) as pool:
+        futures = {pool.submit(_typeset, tex): tex for tex in found}
+        for future in as_completed(futures):
+            tex = futures[future]
+            try:
+                future.result()
+            except Exception as exc:
+                failures[tex] = exc
+                files = ", ".join(sorted(found[tex]))
+                print(f"  FAILED ({files}): {tex}\n    {exc}")
+
+    print(f"Done in {time.perf_counter() - start:.1f}s, {len(found) - len(failures)} ok, "
+          f"{len(failures)} failed")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prewarm the TeX cache for scene files.")
+    parser.add_argument("files", nargs="*", help="scene files (default: every scene in the repo)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--media-dir", default="./media", help="Manim media dir holding the Tex cache")
+    args = parser.parse_args()
+
+    paths = [Path(f) for f in args.files] or scene_files()
+    failures = prewarm(paths, args.workers, args.media_dir)
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
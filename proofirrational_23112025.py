@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,6 +10,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class Root2Irrational(Scene):
     def construct(self):
         # -----------------------------
@@ -43,8 +47,7 @@ class Root2Irrational(Scene):
         self.play(FadeOut(question, shift=DOWN))
 
         # Step scroll container
-        steps_group = VGroup()
-        start_y = config.frame_height / 4
+        scroller = StepScroller(self, max_width=text_width)
 
         # Stickman generator
         def create_stickman(center_point, gender="male"):
@@ -69,14 +72,8 @@ class Root2Irrational(Scene):
             return stickman
 
         # Method to animate steps
-        def add_step(step_mob, gender="male"):
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
-
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index, gender="male"):
+            step_mob = scroller.items[index]
 
             stickman = create_stickman(step_mob.get_bottom() + DOWN * 0.4, gender=gender)
             self.add(stickman)
@@ -103,15 +100,7 @@ class Root2Irrational(Scene):
 
             self.remove(stickman, pointer)
 
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=0.5,
-                    rate_func=smooth
-                )
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # Steps for the irrationality of √2
@@ -134,8 +123,9 @@ class Root2Irrational(Scene):
         ]
 
         # play steps
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(1.5)
 
@@ -0,0 +1,230 @@
+# Batch render every scene in the repo with a pool of worker processes.
+#
+# Scenes come from the static index (scene_index.py). One `manim`
+# invocation per scene pays interpreter start-up, the Manim
+# import and config set-up every time. Here each worker imports Manim once
+# and renders scene after scene; every job runs inside its own tempconfig so
+# a scene's top-of-file config changes don't leak into the next one. Jobs get
+# a wall-clock timeout (SIGALRM in the worker) and workers an address-space
+# limit; jobs lost to a worker killed by the limit are retried once, each in
+# a worker of its own, and only a job that dies again counts as crashed. The
+# run ends with a table of wall time, output size and failures.
+#
+# Usage:
+#     python render_all.py                        # every scene, one worker per core
+#     python render_all.py trigwaves.py -j 4 -q h
+#     python render_all.py --timeout 900 --memory-mb 4096
+#     python render_all.py --incremental          # skip scenes whose inputs didn't change
+
+import argparse
+import importlib.util
+import os
+import resource
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from incremental import FingerprintStore, plan, print_plan
+from scene_index import build_index, scenes
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+class RenderTimeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise RenderTimeout()
+
+
+def _init_worker(memory_mb):
+    if memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    signal.signal(signal.SIGALRM, _on_alarm)
+    import manim  # noqa: F401  (paid once per worker, not once per scene)
+
+
+def load_scene_class(path, class_name, module_name):
+    """Import ``path`` under a fresh module name (re-running its config block)."""
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+def render_job(path, class_name, quality, media_dir, timeout, overrides=None):
+    """Render one scene; returns (seconds, output path or None). Runs in a worker."""
+    from manim import config, tempconfig
+
+    path = Path(path)
+    options = {
+        "input_file": str(path),
+        "media_dir": media_dir,
+        "preview": False,
+        "progress_bar": "none",
+        "write_to_movie": True,
+        **(overrides or {}),
+    }
+    start = time.perf_counter()
+    if timeout:
+        signal.alarm(timeout)
+    try:
+        with tempconfig(options):
+            # quality is a derived setting (resolution + frame rate), so set it
+            # inside the context where those get restored afterwards
+            config.quality = quality
+            scene_class = load_scene_class(path, class_name, f"_render_{path.stem}_{os.getpid()}")
+            scene = scene_class()
+            scene.render()
+            movie = scene.renderer.file_writer.movie_file_path
+    finally:
+        signal.alarm(0)
+    return time.perf_counter() - start, str(movie) if movie else None
+
+
+def discover(paths=None):
+    """(file, scene class) pairs for the given files, or every scene in the repo."""
+    found = scenes(build_index())
+    if paths:
+        wanted = {Path(p).resolve() for p in paths}
+        found = [(path, name) for path, name in found if path.resolve() in wanted]
+    return found
+
+
+def _outcome(future):
+    """(status, seconds, result_or_error) of a finished job future."""
+    try:
+        seconds, output = future.result()
+        return ("ok", seconds, output)
+    except BrokenProcessPool:
+        return ("crashed", None, "worker died (memory limit?)")
+    except RenderTimeout:
+        return ("timeout", None, None)
+    except Exception as exc:
+        return ("failed", None, f"{type(exc).__name__}: {exc}")
+
+
+def _run_isolated(jobs, workers, memory_mb, submit, results):
+    """Run every job in its own single-worker pool, at most ``workers`` at a time.
+
+    A crash there can only be the job's own, so it is reported as such.
+    """
+    pending = list(jobs)
+    running = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            job = pending.pop(0)
+            pool = ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(memory_mb,))
+            running[submit(pool, job)] = (job, pool)
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            job, pool = running.pop(future)
+            results[job] = _outcome(future)
+            pool.shutdown()
+
+
+def run_jobs(jobs, workers, memory_mb, submit):
+    """Run ``submit(pool, job)`` futures for every job, retrying crashed workers.
+
+    Returns {job: (status, seconds, result_or_error)}. When a worker dies
+    (memory limit, segfault) the whole pool breaks and every unfinished job
+    fails with it, not just the one that caused it. Those jobs are retried
+    once, each in a fresh pool of its own, so only the job that crashes again
+    on its own is reported as crashed.
+    """
+    results = {}
+    broken = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(memory_mb,)) as pool:
+        futures = {submit(pool, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            outcome = _outcome(future)
+            if outcome[0] == "crashed":
+                broken.append(job)
+            else:
+                results[job] = outcome
+    if broken:
+        _run_isolated(broken, workers, memory_mb, submit, results)
+    return results
+
+
+def print_summary(jobs, results, wall):
+    rows = []
+    total_bytes = 0
+    for path, name in jobs:
+        status, seconds, detail = results[(path, name)]
+        size = ""
+        if status == "ok" and detail and Path(detail).exists():
+            nbytes = Path(detail).stat().st_size
+            total_bytes += nbytes
+            size = f"{nbytes / (1024 * 1024):.1f}"
+        rows.append((name, Path(path).name, status, f"{seconds:.1f}" if seconds else "", size))
+
+    header = ("Scene", "File", "Status", "Time s", "Size MB")
+    widths = [max(len(str(r[i])) for r in [header, *rows]) for i in range(len(header))]
+    line = "  ".join("{:<%d}" % w for w in widths)
+    print(line.format(*header))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print(line.format(*row))
+    failed = [(job, results[job]) for job in jobs if results[job][0] != "ok"]
+    print(f"\n{len(jobs) - len(failed)}/{len(jobs)} rendered in {wall:.1f}s wall, "
+          f"{total_bytes / (1024 * 1024):.1f} MB output")
+    for (path, name), (status, _, detail) in failed:
+        print(f"  {status.upper()}: {Path(path).name}::{name}" + (f" - {detail}" if detail else ""))
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every scene with a worker pool.")
+    parser.add_argument("files", nargs="*", help="scene files (default: every scene in the repo)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: cores)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h", help="manim quality flag")
+    parser.add_argument("--media-dir", default="./media")
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per scene (0: none)")
+    parser.add_argument("--memory-mb", type=int, default=0, help="address-space limit per worker (0: none)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only render scenes whose fingerprint changed (see incremental.py)")
+    args = parser.parse_args()
+
+    jobs = discover([Path(f) for f in args.files])
+    quality = QUALITIES[args.quality]
+    if args.incremental:
+        store = FingerprintStore(args.media_dir)
+        to_render, up_to_date, inputs = plan(jobs, quality, store)
+        print_plan(to_render, up_to_date)
+        jobs = [job for job in jobs if job in to_render]
+        if not jobs:
+            return
+    workers = min(args.workers or os.cpu_count() or 1, len(jobs)) or 1
+    print(f"Rendering {len(jobs)} scenes with {workers} workers ({quality})")
+
+    start = time.perf_counter()
+    results = run_jobs(
+        jobs, workers, args.memory_mb,
+        lambda pool, job: pool.submit(render_job, str(job[0]), job[1], quality,
+                                      args.media_dir, args.timeout),
+    )
+    failed = print_summary(jobs, results, time.perf_counter() - start)
+    if args.incremental:
+        for job in jobs:
+            status, _, output = results[job]
+            if status == "ok":
+                store.record(*job, inputs[job], output)
+        store.save()
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# Render one scene's pages in parallel and stitch them back together.
+#
+# Scenes are a sequence of pages separated by self.clear() (title, question,
+# steps, graphs, closing card) that share no state across the clear. A quick
+# pass with skip_animations records the animation number at every
+# self.clear() / self.next_section() call. Each page is then rendered by its
+# own worker using Manim's from/upto animation numbers: the worker still runs
+# construct() from the top, but skips earlier animations without drawing
+# frames, so every page starts from the exact state it has in the full render.
+# The page videos are joined with ffmpeg's concat demuxer (stream copy, no
+# re-encode), so frames and timing match a single-process render and wall
+# time is bounded by the slowest page.
+#
+# Usage:
+#     python render_sections.py differential_14112025.py -j 4 -q h
+#     python render_sections.py trigwaves.py PairedTrigGraphs
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import QUALITIES, _init_worker, discover, load_scene_class, render_job
+
+
+def page_boundaries(path, class_name, quality, media_dir):
+    """(animation numbers where a page starts, total animations). Runs in a worker."""
+    from manim import Scene, config, tempconfig
+
+    marks = []
+    original_clear, original_next_section = Scene.clear, Scene.next_section
+
+    def clear(self):
+        marks.append(self.renderer.num_plays)
+        return original_clear(self)
+
+    def next_section(self, *args, **kwargs):
+        marks.append(self.renderer.num_plays)
+        return original_next_section(self, *args, **kwargs)
+
+    Scene.clear, Scene.next_section = clear, next_section
+    try:
+        options = {"input_file": str(path), "media_dir": media_dir, "write_to_movie": False,
+                   "save_last_frame": False, "preview": False, "progress_bar": "none"}
+        with tempconfig(options):
+            config.quality = quality
+            scene_class = load_scene_class(Path(path), class_name, f"_pages_{Path(path).stem}_{os.getpid()}")
+            scene = scene_class(skip_animations=True)
+            scene.render()
+            total = scene.renderer.num_plays
+    finally:
+        Scene.clear, Scene.next_section = original_clear, original_next_section
+    return marks, total
+
+
+def page_ranges(marks, total):
+    """[(from, upto)] animation ranges, upto inclusive and -1 for "to the end".
+
+    Manim treats 0 as "not set" for both limits, so a page can't end at
+    animation 0; a boundary that would need that is merged into the next page.
+    """
+    starts = [0] + sorted({m for m in marks if 1 < m < total})
+    ends = [start - 1 for start in starts[1:]] + [-1]
+    return list(zip(starts, ends))
+
+
+def concat_videos(parts, output):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for part in parts:
+            listing.write(f"file '{Path(part).resolve()}'\n")
+    try:
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", listing.name, "-c", "copy", str(output)], check=True)
+    finally:
+        os.unlink(listing.name)
+    return output
+
+
+def render_pages(path, class_name, quality, media_dir="./media", workers=None, timeout=0):
+    """Render ``class_name`` page-parallel; returns the stitched video path."""
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                             initializer=_init_worker, initargs=(0,)) as pool:
+        marks, total = pool.submit(page_boundaries, str(path), class_name, quality, media_dir).result()
+        ranges = page_ranges(marks, total)
+        print(f"{Path(path).name}::{class_name}: {total} animations, {len(ranges)} pages")
+
+        futures = []
+        for i, (first, last) in enumerate(ranges):
+            overrides = {
+                "from_animation_number": first,
+                "upto_animation_number": last,
+                "output_file": f"{class_name}_page{i:02d}",
+                # Separate partial movie dirs so pages don't share a file list
+                "partial_movie_dir": f"{{media_dir}}/videos/{{module_name}}/{{quality}}/partial_movie_files/page{i:02d}",
+            }
+            futures.append(pool.submit(render_job, str(path), class_name, quality, media_dir, timeout, overrides))
+        parts = []
+        for i, future in enumerate(futures):
+            seconds, output = future.result()
+            first, last = ranges[i]
+            print(f"  page {i}: animations {first}..{last if last >= 0 else 'end'} in {seconds:.1f}s")
+            parts.append(output)
+
+    output = Path(parts[0]).with_name(f"{class_name}.mp4")
+    concat_videos(parts, output)
+    print(f"Stitched {output} in {time.perf_counter() - start:.1f}s wall")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render one scene's pages in parallel.")
+    parser.add_argument("file", help="scene file")
+    parser.add_argument("scene", nargs="?", help="Scene class (default: every scene in the file)")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("--media-dir", default="./media")
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per page (0: none)")
+    args = parser.parse_args()
+
+    for path, name in discover([Path(args.file)]):
+        if args.scene in (None, name):
+            render_pages(path, name, QUALITIES[args.quality], args.media_dir, args.workers, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Time-dependent graph y = f(x, t) from values sampled once on an (x, t) grid.
+#
+# always_redraw(lambda: axes.plot(...)) re-samples the function, rebuilds the
+# bezier points and allocates a fresh ParametricFunction on every frame.
+# TimeSampledCurve evaluates the field once over the whole grid with NumPy
+# (optionally into a memory-mapped .npy for long sweeps), and each frame only
+# interpolates between the two nearest time samples and writes the y
+# components of one curve's points in place.
+#
+# Usage:
+#     curve = TimeSampledCurve.from_function(
+#         axes, lambda x, t: np.exp(-(x - t)**2), x_range=(-5, 5), t_range=(0, 8),
+#         color=BLUE,
+#     )
+#     curve.follow(t_tracker)
+#     self.play(t_tracker.animate.set_value(8), run_time=4, rate_func=linear)
+
+from manim import *
+
+from plotting import coords_to_points
+
+FRAME_CHUNK = 64  # time samples evaluated per batch when filling the grid
+
+
+def frame_buffer(shape, path=None, dtype=np.float32):
+    """Array for (time, x) samples; a memory-mapped .npy at ``path`` if given."""
+    if path is None:
+        return np.empty(shape, dtype=dtype)
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+
+def sample_field(field, xs, ts, path=None, dtype=np.float32):
+    """field(x, t) on the grid as a (len(ts), len(xs)) array, memory-mapped if ``path``."""
+    values = frame_buffer((len(ts), len(xs)), path, dtype)
+    for start in range(0, len(ts), FRAME_CHUNK):
+        chunk = ts[start:start + FRAME_CHUNK]
+        values[start:start + len(chunk)] = field(xs[None, :], chunk[:, None])
+    if path is not None:
+        values.flush()
+    return values
+
+
+class TimeSampledCurve(VMobject):
+    def __init__(self, axes, xs, ts, values, **kwargs):
+        super().__init__(**kwargs)
+        self.xs = np.asarray(xs, dtype=float)
+        self.ts = np.asarray(ts, dtype=float)
+        self.values = values
+        self.time = None
+
+        # Straight segments between samples: anchor, 1/3, 2/3, anchor per curve,
+        # so the points are an affine function of the sampled y values
+        origin = coords_to_points(axes, [0.0], [0.0])[0]
+        self.y_unit = coords_to_points(axes, [0.0], [1.0])[0] - origin
+        self.base = self._corner_values(coords_to_points(axes, self.xs, np.zeros_like(self.xs)))
+        self.set_points(self.base.copy())
+        self.set_time(self.ts[0])
+
+    @classmethod
+    def from_function(cls, axes, field, x_range=None, t_range=(0, 1), samples=600, frames=241,
+                      path=None, **kwargs):
+        x_min, x_max = axes.x_range[:2] if x_range is None else x_range[:2]
+        xs = np.linspace(x_min, x_max, samples)
+        ts = np.linspace(t_range[0], t_range[1], frames)
+        return cls(axes, xs, ts, sample_field(field, xs, ts, path), **kwargs)
+
+    @staticmethod
+    def _corner_values(anchors):
+        start, end = anchors[:-1], anchors[1:]
+        corners = np.stack([start, (2 * start + end) / 3, (start + 2 * end) / 3, end], axis=1)
+        return corners.reshape(-1, *anchors.shape[1:])
+
+    def values_at(self, t):
+        """Sampled y values at time ``t``, linearly interpolated between time samples."""
+        if len(self.ts) == 1:
+            return np.asarray(self.values[0], dtype=float)
+        t = float(np.clip(t, self.ts[0], self.ts[-1]))
+        i = int(np.clip(np.searchsorted(self.ts, t, side="right") - 1, 0, len(self.ts) - 2))
+        w = (t - self.ts[i]) / (self.ts[i + 1] - self.ts[i])
+        return (1 - w) * self.values[i] + w * self.values[i + 1]
+
+    def set_time(self, t):
+        if t == self.time:
+            return self
+        self.time = t
+        ys = self._corner_values(self.values_at(t))
+        np.add(self.base, ys[:, None] * self.y_unit, out=self.points)
+        return self
+
+    def follow(self, tracker):
+        """Keep the curve at the time held by ``tracker`` (a ValueTracker)."""
+        self.add_updater(lambda mob: mob.set_time(tracker.get_value()))
+        return self
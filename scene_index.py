@@ -0,0 +1,311 @@
+# Static index of the scene files, built without importing them.
+#
+# Importing a scene module runs `from manim import *` and rewrites the global
+# config, which is slow and depends on import order. This module parses the
+# files with ast instead and records, per file: a content hash, the top-level
+# config overrides, the local helper modules it imports and every Scene
+# subclass with an estimate of its self.play / self.wait / self.clear calls
+# (counted from construct(), following calls into local helper defs and
+# methods, and weighted by loop counts that are known statically). The result
+# is cached in scene_index.json next to the scenes and only re-parsed for
+# files whose hash changed, so batch tooling can query it in milliseconds.
+#
+# Usage:
+#     python scene_index.py          # refresh and print the index
+#     python scene_index.py --json   # refresh and dump the manifest
+#
+#     from scene_index import build_index, scenes
+#     for path, scene in scenes(build_index()): ...
+
+import argparse
+import ast
+import hashlib
+import json
+import operator
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+MANIFEST = REPO_ROOT / "scene_index.json"
+MANIFEST_VERSION = 2
+SCENE_BASES = {"Scene", "MovingCameraScene", "ThreeDScene", "ZoomedScene"}
+COUNTED_CALLS = ("play", "wait", "clear")
+
+_OPERATORS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Pow: operator.pow,
+}
+
+
+def scene_classes(path):
+    """Names of the Scene subclasses defined in ``path``, found without importing it."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    return [node.name for node in _scene_nodes(tree)]
+
+
+def is_scene_file(path):
+    return bool(scene_classes(path))
+
+
+def scene_files(root=REPO_ROOT):
+    return sorted(p for p in Path(root).glob("*.py") if is_scene_file(p))
+
+
+def _scene_nodes(tree):
+    return [
+        node for node in tree.body
+        if isinstance(node, ast.ClassDef)
+        and any(isinstance(base, ast.Name) and base.id in SCENE_BASES for base in node.bases)
+    ]
+
+
+def _value(node):
+    """Constant value of a config expression like ``6 * (1920 / 1080)``, else its source."""
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        pass
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        left, right = _value(node.left), _value(node.right)
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            try:
+                return _OPERATORS[type(node.op)](left, right)
+            except ArithmeticError:
+                pass
+    return ast.unparse(node)
+
+
+def config_overrides(tree):
+    overrides = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                    and target.value.id == "config"):
+                overrides[target.attr] = _value(node.value)
+    return overrides
+
+
+def local_imports(tree, root=REPO_ROOT):
+    """Helper modules of this repo that the file imports."""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+        elif isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+    return sorted(name for name in names if (Path(root) / f"{name}.py").exists())
+
+
+def _call_name(call):
+    """``"name"`` or ``"obj.name"`` for simple calls, else None."""
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        return f"{func.value.id}.{func.attr}"
+    return None
+
+
+def _local_functions(node):
+    """Functions defined inside ``node``, without looking into their bodies."""
+    found = {}
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            found[child.name] = child
+        elif not isinstance(child, ast.ClassDef):
+            found.update(_local_functions(child))
+    return found
+
+
+def _literal_bindings(node):
+    """Names assigned a list or tuple literal anywhere under ``node``."""
+    found = {}
+    for child in ast.walk(node):
+        if isinstance(child, ast.Assign) and isinstance(child.value, (ast.List, ast.Tuple)):
+            for target in child.targets:
+                if isinstance(target, ast.Name):
+                    found[target.id] = child.value
+    return found
+
+
+def _length(node, bindings):
+    if isinstance(node, ast.Name):
+        node = bindings.get(node.id, node)
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return len(node.elts)
+    return None
+
+
+def _int_arg(node, bindings):
+    if isinstance(node, ast.Call) and _call_name(node) == "len" and len(node.args) == 1:
+        return _length(node.args[0], bindings)
+    value = _value(node)
+    return value if isinstance(value, int) else None
+
+
+def _loop_count(it, bindings=None):
+    """Iterations of ``for ... in it`` when they are statically known, else None."""
+    bindings = bindings or {}
+    length = _length(it, bindings)
+    if length is not None:
+        return length
+    if isinstance(it, ast.Call):
+        name = it.func.attr if isinstance(it.func, ast.Attribute) else getattr(it.func, "id", None)
+        if name == "range":
+            args = [_int_arg(a, bindings) for a in it.args]
+            if args and all(a is not None for a in args):
+                return len(range(*args))
+        if name == "linspace":
+            args = [_value(a) for a in it.args]
+            if len(args) >= 3 and isinstance(args[2], int):
+                return args[2]
+        if name == "enumerate" and it.args:
+            return _loop_count(it.args[0], bindings)
+    return None
+
+
+def count_calls(node, weight=1, counts=None, functions=None, bindings=None, expanding=()):
+    """Estimated number of self.play / self.wait / self.clear calls made by ``node``.
+
+    Calls to the helpers in ``functions`` (keyed ``"name"`` for local defs and
+    ``"self.name"`` for methods) are followed into the helper, weighted by the
+    loops around the call; the helper defs themselves only count when called.
+    Loops over ``range(len(x))`` resolve ``x`` through ``bindings``.
+    """
+    if counts is None:
+        counts = dict.fromkeys(COUNTED_CALLS, 0)
+    functions = functions or {}
+    bindings = bindings or {}
+    helpers = set(map(id, functions.values()))
+    for child in ast.iter_child_nodes(node):
+        if id(child) in helpers:
+            continue
+        child_weight = weight
+        if isinstance(child, ast.For):
+            child_weight = weight * (_loop_count(child.iter, bindings) or 1)
+        elif isinstance(child, ast.Call):
+            name = _call_name(child)
+            if name is not None and name.startswith("self.") and name[5:] in COUNTED_CALLS:
+                counts[name[5:]] += weight
+            elif name in functions and name not in expanding:
+                count_calls(functions[name], weight, counts, functions, bindings, (*expanding, name))
+        count_calls(child, child_weight, counts, functions, bindings, expanding)
+    return counts
+
+
+def count_scene_calls(node):
+    """count_calls for a Scene class, starting at construct() and following its helpers."""
+    methods = {
+        f"self.{child.name}": child for child in node.body
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+    construct = methods.get("self.construct")
+    if construct is None:
+        return count_calls(node)
+    functions = dict(methods)
+    for method in methods.values():
+        functions.update(_local_functions(method))
+    return count_calls(construct, functions=functions, bindings=_literal_bindings(node),
+                       expanding=("self.construct",))
+
+
+def duplicate_scene_names(manifest):
+    """{Scene class name: [files]} for names defined in more than one file."""
+    files = {}
+    for name, entry in sorted(manifest["files"].items()):
+        for scene in entry["scenes"]:
+            files.setdefault(scene["name"], []).append(name)
+    return {scene: names for scene, names in files.items() if len(names) > 1}
+
+
+def index_file(path, source=None):
+    path = Path(path)
+    source = path.read_bytes() if source is None else source
+    tree = ast.parse(source.decode("utf-8"))
+    return {
+        "sha256": hashlib.sha256(source).hexdigest(),
+        "config": config_overrides(tree),
+        "imports": local_imports(tree, path.parent),
+        "scenes": [
+            {
+                "name": node.name,
+                "bases": [ast.unparse(base) for base in node.bases],
+                "line": node.lineno,
+                **{f"{call}s": n for call, n in count_scene_calls(node).items()},
+            }
+            for node in _scene_nodes(tree)
+        ],
+    }
+
+
+def load_manifest(path=MANIFEST):
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "files": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "files": {}}
+    return manifest
+
+
+def build_index(root=REPO_ROOT, path=MANIFEST):
+    """Refresh the manifest for every .py file under ``root`` and return it.
+
+    Files whose hash matches their manifest entry are not re-parsed; files
+    without Scene subclasses are left out.
+    """
+    manifest = load_manifest(path)
+    old = manifest["files"]
+    files = {}
+    for py in sorted(Path(root).glob("*.py")):
+        source = py.read_bytes()
+        entry = old.get(py.name)
+        if entry is None or entry["sha256"] != hashlib.sha256(source).hexdigest():
+            entry = index_file(py, source)
+        if entry["scenes"]:
+            files[py.name] = entry
+    if files != old:
+        manifest["files"] = files
+        Path(path).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return manifest
+
+
+def scenes(manifest, root=REPO_ROOT):
+    """(file path, Scene class name) for every scene in the manifest."""
+    return [
+        (Path(root) / name, scene["name"])
+        for name, entry in sorted(manifest["files"].items())
+        for scene in entry["scenes"]
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the static scene index.")
+    parser.add_argument("--json", action="store_true", help="print the manifest as JSON")
+    args = parser.parse_args()
+
+    manifest = build_index()
+    if args.json:
+        print(json.dumps(manifest, indent=2, sort_keys=True))
+        return
+    rows = [
+        (scene["name"], name, scene["plays"], scene["waits"], scene["clears"], entry["sha256"][:12])
+        for name, entry in sorted(manifest["files"].items())
+        for scene in entry["scenes"]
+    ]
+    header = ("Scene", "File", "play", "wait", "clear", "sha256")
+    widths = [max(len(str(r[i])) for r in [header, *rows]) for i in range(len(header))]
+    line = "  ".join("{:<%d}" % w for w in widths)
+    print(line.format(*header))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print(line.format(*row))
+    # Scenes are always addressed as (file, class); same-named classes only
+    # clash when rendered by name alone, e.g. with `manim <file> <Scene>` globs
+    for scene, names in duplicate_scene_names(manifest).items():
+        print(f"warning: {scene} is defined in {', '.join(names)}")
+
+
+if __name__ == "__main__":
+    main()
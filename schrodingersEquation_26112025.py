@@ -1,5 +1,9 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from sampled_curve import TimeSampledCurve
+from schrodinger_solver import SplitStepSolver, gaussian_packet
+from cache_setup import install_caches
 
 # TikTok portrait
 config.pixel_width = 1080
@@ -8,7 +12,9 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
-class ShrodingerEquation(Scene):
+install_caches(__file__)
+
+class ShrodingerEquation(MovingCameraScene):
     def construct(self):
         # -----------------------------
         # Title
@@ -47,8 +53,7 @@ class ShrodingerEquation(Scene):
         left_padding = 1.0
         right_padding = 1.0
         text_width = config.frame_width - left_padding - right_padding
-        start_y = config.frame_height / 4
-        steps_group = VGroup()
+        scroller = StepScroller(self, mode="camera")
 
         def create_stickman(center_point):
             head_radius = 0.15
@@ -70,22 +75,9 @@ class ShrodingerEquation(Scene):
                              body_bottom + RIGHT*leg_length + DOWN*0.4, color=YELLOW)
             return VGroup(head, body, arm_left, arm_right, leg_left, leg_right)
 
-        def add_step(step_mob, highlight=False):
-            step_mob.set(width=min(step_mob.width, text_width))
-
-            # If highlighted, create a rectangle around step
-            if highlight:
-                rect = SurroundingRectangle(step_mob, color=RED, buff=0.15)
-                step_group = VGroup(step_mob, rect)
-            else:
-                step_group = step_mob
-
-            steps_group.add(step_group)
-
-            if len(steps_group) == 1:
-                step_group.move_to(UP * start_y)
-            else:
-                step_group.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_group = scroller.items[index]
+            step_mob = steps_list[index]
 
             stickman = create_stickman(step_group.get_bottom() + DOWN*0.8)
             self.add(stickman)
@@ -110,11 +102,8 @@ class ShrodingerEquation(Scene):
 
             self.remove(stickman, pointer)
 
-            # Scroll steps if more than 4
-            if len(steps_group) > 4:
-                shift_amount = steps_group[-5].height + 0.7
-                self.play(steps_group.animate.shift(UP*shift_amount), run_time=0.5)
-            else:
+            # Scroll steps once more than 4 are shown
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # -----------------------------
@@ -145,17 +134,26 @@ class ShrodingerEquation(Scene):
 
         highlight_indices = [11, 17]
 
+        # If highlighted, create a rectangle around step
+        step_items = []
         for idx, step in enumerate(steps_list):
+            step.set(width=min(step.width, text_width))
             if idx in highlight_indices:
-                add_step(step, highlight=True)
+                rect = SurroundingRectangle(step, color=RED, buff=0.15)
+                step_items.append(VGroup(step, rect))
             else:
-                add_step(step)
+                step_items.append(step)
+
+        scroller.layout(step_items)
+        for idx in range(len(steps_list)):
+            add_step(idx)
 
         self.wait(1)
 
         # -----------------------------
         # GRAPH SLIDE
         # -----------------------------
+        scroller.finish()
         self.clear()
 
         graph_title = Text("Free Particle Wave Packet", font_size=30, color=ORANGE)
@@ -183,17 +181,16 @@ class ShrodingerEquation(Scene):
         hbar = 1
         t_tracker = ValueTracker(0)
 
-        def psi_real(x):
-            t = t_tracker.get_value()
-            sigma_t = sigma * np.sqrt(1 + (hbar * t / (m * sigma**2))**2)
-            prefactor = sigma / sigma_t
-            x_shift = x0 + (hbar * k0 / m) * t
-            phase = np.exp(1j * (k0 * (x - hbar * k0 * t / (2*m))))
-            gaussian = np.exp(-((x - x_shift)**2) / (2*sigma_t**2))
-            psi = prefactor * gaussian * phase
-            return np.real(psi)
-
-        wavefunction = always_redraw(lambda: axes.plot(psi_real, color=BLUE))
+        # Free particle: V = 0. Any V(x) (barrier, well, ...) drops in here
+        def potential(x):
+            return np.zeros_like(x)
+
+        solver = SplitStepSolver(potential, x_range=(-20, 20), hbar=hbar, m=m)
+        xs, ts, psi_real = solver.evolve(
+            gaussian_packet(x0, sigma, k0), t_range=(0, 8), frames=481,
+            observe="real", x_window=(-5, 5)
+        )
+        wavefunction = TimeSampledCurve(axes, xs, ts, psi_real, color=BLUE).follow(t_tracker)
         self.play(Create(wavefunction), run_time=4)
         self.play(t_tracker.animate.set_value(8), run_time=4, rate_func=linear)
         self.wait(0.5)
@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,6 +10,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class SchwarzschildNewtonian(Scene):
     def construct(self):
         # -----------------------------
@@ -16,9 +20,8 @@ class SchwarzschildNewtonian(Scene):
         left_padding = 1.0
         right_padding = 1.0
         text_width = config.frame_width - left_padding - right_padding
-        start_y = config.frame_height / 4
 
-        steps_group = VGroup()
+        scroller = StepScroller(self, max_width=text_width)
 
         def create_stickman(center_point):
             """Create a stickman with lower arms and angled left arm downwards."""
@@ -53,16 +56,9 @@ class SchwarzschildNewtonian(Scene):
             stickman = VGroup(head, body, arm_left, arm_right, leg_left, leg_right)
             return stickman
 
-        def add_step(step_mob):
+        def add_step(index):
             """Add a step with stickman appearing below the step, then disappearing."""
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
-
-            # Position the step
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+            step_mob = scroller.items[index]
 
             # Add stickman below the step
             stickman = create_stickman(step_mob.get_bottom() + DOWN * 0.4)
@@ -89,16 +85,8 @@ class SchwarzschildNewtonian(Scene):
             # Remove stickman and pointer after writing
             self.remove(stickman, pointer)
 
-            # Scroll previous steps if more than 4
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=0.5,
-                    rate_func=smooth
-                )
-            else:
+            # Scroll previous steps once more than 4 are shown
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # -----------------------------
@@ -155,8 +143,9 @@ class SchwarzschildNewtonian(Scene):
             MathTex(r"\text{the Schwarzschild radius.}", font_size=38, color=BLUE)
         ]
 
-        for s in steps:
-            add_step(s)
+        scroller.layout(steps)
+        for i in range(len(steps)):
+            add_step(i)
 
         self.wait(2)
 
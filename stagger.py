@@ -0,0 +1,62 @@
+# Staggered reveals of a group's submobjects as a single animation.
+#
+# LaggedStart / LaggedStartMap (or a loop of short self.play calls) build one
+# animation per submobject; these compute every submobject's progress from
+# one shared alpha instead, with the same timing as LaggedStart: submobject i
+# starts at i * lag_ratio of a unit step and runs for one unit. With
+# lag_ratio=1 the submobjects appear strictly one after another.
+#
+# Usage:
+#     self.play(StaggeredOpacity(labels, lag_ratio=1), run_time=0.05 * len(labels))
+
+from manim import *
+
+
+def lagged_alphas(alpha, n, lag_ratio):
+    """Progress in [0, 1] of each of ``n`` staggered parts at overall ``alpha``."""
+    span = 1 + lag_ratio * max(n - 1, 0)
+    return np.clip(alpha * span - np.arange(n) * lag_ratio, 0, 1)
+
+
+def _smooth(t, inflection=10.0):
+    error = sigmoid(-inflection / 2)
+    return np.clip((sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error), 0, 1)
+
+
+# Array versions of Manim rate functions that only accept scalars
+_ARRAY_RATE_FUNCS = {smooth: _smooth, linear: lambda t: t}
+
+
+def eased(rate_func, values):
+    """``rate_func`` applied to every entry of ``values``, in one NumPy call when possible."""
+    values = np.asarray(values, dtype=float)
+    if rate_func in _ARRAY_RATE_FUNCS:
+        return _ARRAY_RATE_FUNCS[rate_func](values)
+    try:
+        result = np.asarray(rate_func(values), dtype=float)
+        if result.shape == values.shape:
+            return result
+    except (TypeError, ValueError):
+        pass
+    return np.array([rate_func(t) for t in values])
+
+
+class StaggeredOpacity(Animation):
+    """Fade the submobjects of ``group`` in from 0 to full opacity, staggered."""
+
+    def __init__(self, group, lag_ratio=1.0, sub_rate_func=smooth, rate_func=linear, **kwargs):
+        self.stagger = lag_ratio
+        self.sub_rate_func = sub_rate_func
+        super().__init__(group, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.shown = np.full(len(self.mobject.submobjects), -1.0)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        local = lagged_alphas(alpha, len(self.mobject.submobjects), self.stagger)
+        # Only the parts whose progress moved this frame need touching
+        changed = np.flatnonzero(local != self.shown)
+        for i, opacity in zip(changed, eased(self.sub_rate_func, local[changed])):
+            self.mobject.submobjects[i].set_opacity(opacity)
+        self.shown = local
@@ -0,0 +1,172 @@
+# Shared step-by-step scroller for the derivation pages.
+#
+# Replaces the add_step closures that every scene used to copy-paste. The
+# whole column of steps is laid out once, before any animation starts, with
+# the same spacing as the old closures (first step centred at
+# config.frame_height / 4, each next step 0.7 below the previous one). Each
+# scroll then only animates the steps that are actually on screen, and steps
+# that leave the frame are detached from the scene (so Cairo stops drawing
+# them) until a scroll brings them back. Per-frame cost therefore depends on
+# how many steps fit on screen, not on how long the derivation is.
+#
+# With mode="camera" (the scene must be a MovingCameraScene) the steps stay
+# put in scene space and the scroll moves the camera frame down instead, so
+# a scroll costs the same however many steps are on the page. Call
+# scroller.finish() before self.clear() to put the camera back for the next
+# page.
+#
+# Usage (inside Scene.construct):
+#
+#     scroller = StepScroller(self, max_width=text_width)
+#     scroller.layout(steps_list)
+#     for i, step in enumerate(steps_list):
+#         self.play(Write(step))
+#         if not scroller.scroll(i):
+#             self.wait(0.5)
+#     scroller.finish()
+
+from manim import *
+import numpy as np
+
+
+class StepScroller:
+    def __init__(self, scene, max_width=None, start_y=None, first_top=None,
+                 buff=0.7, max_visible=4, scroll_time=0.5, rate_func=smooth,
+                 mode="shift"):
+        if mode not in ("shift", "camera"):
+            raise ValueError(f"Unknown scroll mode: {mode}")
+        self.scene = scene
+        self.mode = mode
+        self.max_width = max_width
+        # Centre of the first step; ignored when first_top pins its top edge
+        self.start_y = config.frame_height / 4 if start_y is None else start_y
+        self.first_top = first_top
+        self.buff = buff
+        self.max_visible = max_visible
+        self.scroll_time = scroll_time
+        self.rate_func = rate_func
+
+        self.items = []
+        self.tops = np.zeros(0)
+        self.bottoms = np.zeros(0)
+        self.offsets = np.zeros(0)  # total scroll after step i has been shown
+        self.applied = np.zeros(0)  # scroll currently baked into each item
+        self.detached = np.zeros(0, dtype=bool)
+        self.offset = 0.0
+
+    def layout(self, steps):
+        """Clamp, measure and place every step in one pass."""
+        self.items = list(steps)
+        n = len(self.items)
+        self.tops = np.zeros(n)
+        self.bottoms = np.zeros(n)
+        self.offsets = np.zeros(n)
+        self.applied = np.zeros(n)
+        self.detached = np.zeros(n, dtype=bool)
+        self.offset = 0.0
+
+        heights = np.zeros(n)
+        offset = 0.0
+        for i, mob in enumerate(self.items):
+            if self.max_width is not None:
+                mob.set_width(min(mob.width, self.max_width))
+            heights[i] = mob.height
+
+            if i == 0:
+                top = self.first_top if self.first_top is not None else self.start_y + heights[0] / 2
+            else:
+                top = self.bottoms[i - 1] - self.buff
+            self.tops[i] = top
+            self.bottoms[i] = top - heights[i]
+
+            # Steps appear at whatever scroll the previous step left behind;
+            # in camera mode they never move, the frame comes to them
+            reveal_offset = offset if self.mode == "shift" else 0.0
+            mob.move_to([0, top - heights[i] / 2 + reveal_offset, 0])
+            self.applied[i] = reveal_offset
+
+            if i >= self.max_visible:
+                offset += heights[i - self.max_visible] + self.buff
+            self.offsets[i] = offset
+        return self
+
+    def window(self, offset=None):
+        """Index range [lo, hi) of the steps inside the frame at ``offset``."""
+        offset = self.offset if offset is None else offset
+        half = config.frame_height / 2
+        # tops/bottoms decrease down the column, so both edges are a bisection
+        lo = int(np.searchsorted(-self.bottoms, offset - half, side="right"))
+        hi = int(np.searchsorted(-self.tops, offset + half, side="left"))
+        return lo, hi
+
+    def scroll(self, index, run_time=None, rate_func=None):
+        """Play the scroll that follows step ``index``.
+
+        Returns False when no scroll is needed, so callers can wait instead.
+        """
+        return self.scroll_to(self.offsets[index], index + 1, run_time, rate_func)
+
+    def show_step(self, index, shown=None, run_time=None, rate_func=None):
+        """Scroll back (or forward) so step ``index`` sits in the first slot."""
+        shown = len(self.items) if shown is None else shown
+        offset = min(max(self.tops[0] - self.tops[index], 0.0), self.offsets[shown - 1])
+        return self.scroll_to(offset, shown, run_time, rate_func)
+
+    def scroll_to(self, offset, count=None, run_time=None, rate_func=None):
+        """Scroll the first ``count`` steps (all by default) to ``offset``."""
+        count = len(self.items) if count is None else count
+        if abs(offset - self.offset) < 1e-9:
+            return False
+
+        old_lo, old_hi = self.window()
+        new_lo, new_hi = self.window(offset)
+
+        anims = []
+        leaving = []
+        touched = False
+        for i in range(min(old_lo, new_lo), min(max(old_hi, new_hi), count)):
+            was_visible = old_lo <= i < old_hi
+            now_visible = new_lo <= i < new_hi
+            # Steps that are off screen both before and after are left alone
+            if not (was_visible or now_visible):
+                continue
+            mob = self.items[i]
+            if self.detached[i] and self.mode == "shift":
+                # Re-attach where it would have been had it scrolled along
+                mob.shift(UP * (self.offset - self.applied[i]))
+                self.applied[i] = self.offset
+            if self.detached[i] or self.mode == "camera":
+                # The shift animation adds the whole item (highlight box
+                # included) to the scene; do the same when only the frame moves
+                self.scene.add(mob)
+            self.detached[i] = False
+            if self.mode == "shift":
+                anims.append(mob.animate.shift(UP * (offset - self.applied[i])))
+                self.applied[i] = offset
+            touched = True
+            if not now_visible:
+                leaving.append(i)
+
+        if self.mode == "camera" and touched:
+            frame = self.scene.camera.frame
+            anims.append(frame.animate.shift(DOWN * (offset - self.offset)))
+        elif self.mode == "camera":
+            self.scene.camera.frame.shift(DOWN * (offset - self.offset))
+
+        self.offset = offset
+        if anims:
+            self.scene.play(
+                *anims,
+                run_time=self.scroll_time if run_time is None else run_time,
+                rate_func=self.rate_func if rate_func is None else rate_func
+            )
+        for i in leaving:
+            self.scene.remove(self.items[i])
+            self.detached[i] = True
+        return bool(anims)
+
+    def finish(self):
+        """Snap the camera back to the origin once the steps page is over."""
+        if self.mode == "camera":
+            self.scene.camera.frame.move_to(ORIGIN)
+            self.offset = 0.0
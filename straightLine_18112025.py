@@ -1,4 +1,6 @@
 from manim import *
+from step_scroller import StepScroller
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -7,6 +9,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class AdvancedAlgebra(Scene):
     def construct(self):
         # -----------------------------
@@ -42,8 +46,7 @@ class AdvancedAlgebra(Scene):
         self.play(FadeOut(question_group, shift=DOWN))
 
         # Step-by-step solution
-        steps_group = VGroup()
-        start_y = config.frame_height / 4
+        scroller = StepScroller(self, max_width=text_width)
 
         def create_stickman(center_point):
             """Create a stickman with lower arms and angled left arm downwards."""
@@ -76,16 +79,9 @@ class AdvancedAlgebra(Scene):
             stickman = VGroup(head, body, arm_left, arm_right, leg_left, leg_right)
             return stickman
 
-        def add_step(step_mob):
+        def add_step(index):
             """Add a step with stickman appearing below the step, then disappearing."""
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
-
-            # Position the step
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+            step_mob = scroller.items[index]
 
             # Add stickman below the step
             stickman = create_stickman(step_mob.get_bottom() + DOWN * 0.4)
@@ -108,15 +104,7 @@ class AdvancedAlgebra(Scene):
 
             self.remove(stickman, pointer)
 
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=0.5,
-                    rate_func=smooth
-                )
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # Step-by-step solution content
@@ -134,8 +122,9 @@ class AdvancedAlgebra(Scene):
             MathTex(r"\text{Summary: Direction vector, parametric line, closest point to origin}", font_size=34, color=YELLOW)
         ]
 
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(1.5)
 
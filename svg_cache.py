@@ -0,0 +1,157 @@
+# Parsed-SVG point cache stored as memory-mappable NumPy arrays.
+#
+# Even with the TeX cache warm, every MathTex / Text re-parses its SVG with
+# svgelements and flattens the paths into bezier points on every run. This
+# cache stores the result of that parse (per-submobject points and style) as
+# two .npy files per SVG, which are opened with mmap_mode="r" on the next run,
+# so a repeated equation is rebuilt without touching XML at all.
+#
+# Scenes pick it up through cache_setup.install_caches(). Configure with:
+#     MATHIATION_SVG_CACHE   cache directory (default ~/.cache/mathiation/svg)
+#
+# Usage:
+#     python svg_cache.py stats
+#     python svg_cache.py clear
+
+import argparse
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_DIR = Path.home() / ".cache" / "mathiation" / "svg"
+
+# Per-submobject meta row: end offset into the points array, fill rgba,
+# stroke rgba, stroke width
+META_COLUMNS = 10
+
+_original_init_svg_mobject = None
+
+
+def cache_dir():
+    return Path(os.environ.get("MATHIATION_SVG_CACHE", DEFAULT_DIR))
+
+
+def svg_key(svg_mob):
+    """Key on everything Manim's own SVG hash uses, plus the file's bytes."""
+    h = hashlib.sha256()
+    h.update(repr(svg_mob.hash_seed).encode("utf-8"))
+    with open(svg_mob.file_name, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def _paths(key):
+    directory = cache_dir()
+    return directory / f"{key}.points.npy", directory / f"{key}.meta.npy"
+
+
+def load(key):
+    """Rebuild the submobjects for ``key`` from the cache, or return None."""
+    from manim import VMobject
+
+    points_file, meta_file = _paths(key)
+    # meta is written last, so its presence means the entry is complete
+    if not meta_file.exists():
+        return None
+    points = np.load(points_file, mmap_mode="r")
+    meta = np.load(meta_file, mmap_mode="r")
+
+    submobjects = []
+    start = 0
+    for row in meta:
+        end = int(row[0])
+        mob = VMobject()
+        # Copy out of the map: mobjects transform their points in place
+        mob.points = np.array(points[start:end])
+        mob.fill_rgbas = np.array(row[1:5]).reshape(1, 4)
+        mob.stroke_rgbas = np.array(row[5:9]).reshape(1, 4)
+        mob.stroke_width = float(row[9])
+        submobjects.append(mob)
+        start = end
+    return submobjects
+
+
+def store(key, submobjects):
+    directory = cache_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    points_file, meta_file = _paths(key)
+
+    meta = np.zeros((len(submobjects), META_COLUMNS))
+    end = 0
+    for i, mob in enumerate(submobjects):
+        end += len(mob.points)
+        meta[i, 0] = end
+        meta[i, 1:5] = mob.fill_rgbas[0]
+        meta[i, 5:9] = mob.stroke_rgbas[0]
+        meta[i, 9] = mob.stroke_width
+    if submobjects:
+        points = np.concatenate([mob.points for mob in submobjects])
+    else:
+        points = np.zeros((0, 3))
+
+    for path, array in ((points_file, points), (meta_file, meta)):
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp, path)
+
+
+def cached_init_svg_mobject(self, use_svg_cache):
+    from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+    from manim.utils.hashing import hash_obj
+
+    # The in-memory cache is already as fast as it gets
+    if not use_svg_cache or self.file_name is None:
+        return _original_init_svg_mobject(self, use_svg_cache)
+    hash_val = hash_obj(self.hash_seed)
+    if hash_val in SVG_HASH_TO_MOB_MAP:
+        return _original_init_svg_mobject(self, use_svg_cache)
+
+    key = svg_key(self)
+    submobjects = load(key)
+    if submobjects is not None:
+        self.add(*submobjects)
+        # Like Manim's own path, so later loads in this process skip the disk
+        SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
+        return
+
+    _original_init_svg_mobject(self, use_svg_cache)
+    # Nested groups don't flatten into one points array; leave those to Manim
+    if all(not mob.submobjects for mob in self.submobjects):
+        store(key, self.submobjects)
+
+
+def install():
+    """Make SVGMobject (and so MathTex / Text) load parses from the cache (idempotent)."""
+    global _original_init_svg_mobject
+    from manim.mobject.svg.svg_mobject import SVGMobject
+
+    if SVGMobject.init_svg_mobject is cached_init_svg_mobject:
+        return
+    _original_init_svg_mobject = SVGMobject.init_svg_mobject
+    SVGMobject.init_svg_mobject = cached_init_svg_mobject
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the parsed-SVG cache.")
+    parser.add_argument("command", choices=["stats", "clear"])
+    args = parser.parse_args()
+
+    directory = cache_dir()
+    files = list(directory.glob("*.npy")) if directory.exists() else []
+    if args.command == "stats":
+        size = sum(f.stat().st_size for f in files)
+        entries = sum(1 for f in files if f.name.endswith(".meta.npy"))
+        print(f"Cache dir: {directory}")
+        print(f"Entries:   {entries}")
+        print(f"Size:      {size / (1024 * 1024):.1f} MB")
+    else:
+        for f in files:
+            f.unlink()
+        print("Cache cleared")
+
+
+if __name__ == "__main__":
+    main()
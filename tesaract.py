@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,6 +10,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class SchwarzschildScene(Scene):
     def construct(self):
         # -----------------------------
@@ -33,28 +37,13 @@ class SchwarzschildScene(Scene):
         self.play(FadeOut(question_group, shift=DOWN))
 
         # Step group setup
-        steps_group = VGroup()
-        start_y = config.frame_height / 4
-
-        def add_step(step_mob):
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
+        scroller = StepScroller(self, max_width=text_width)
 
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_mob = scroller.items[index]
 
             self.play(Write(step_mob), run_time=1)
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=0.5,
-                    rate_func=smooth
-                )
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # Steps of symbolic derivation
@@ -101,8 +90,9 @@ class SchwarzschildScene(Scene):
             ),
         ]
 
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(2)
 
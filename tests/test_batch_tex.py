@@ -0,0 +1,37 @@
+import re
+import shutil
+
+import pytest
+
+manim = pytest.importorskip("manim")
+if not (shutil.which("latex") and shutil.which("dvisvgm")):
+    pytest.skip("needs latex and dvisvgm", allow_module_level=True)
+
+import batch_tex
+from manim import config, tempconfig
+from manim.utils.tex_file_writing import tex_to_svg_file
+
+EXPRESSIONS = [r"x^2", r"\int_0^\infty e^{-x^2}\,dx = \frac{\sqrt{\pi}}{2}", r"a \\ b + c"]
+
+
+def bounding_box(svg_file):
+    svg = svg_file.read_text(encoding="utf-8")
+    view_box = re.search(r'viewBox=["\']([^"\']+)["\']', svg).group(1)
+    return [float(v) for v in view_box.split()]
+
+
+def test_batch_pages_crop_like_single_compiles(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        assert batch_tex.batch_compile(EXPRESSIONS) == len(EXPRESSIONS)
+        batched = {}
+        for tex in EXPRESSIONS:
+            expression = batch_tex.modified_expression(tex)
+            svg_file = tex_to_svg_file(expression, batch_tex.MATH_ENVIRONMENT, config["tex_template"])
+            batched[tex] = bounding_box(svg_file)
+            svg_file.unlink()
+
+        for tex in EXPRESSIONS:
+            expression = batch_tex.modified_expression(tex)
+            single = bounding_box(tex_to_svg_file(expression, batch_tex.MATH_ENVIRONMENT,
+                                                  config["tex_template"]))
+            assert single == pytest.approx(batched[tex], abs=1e-3), tex
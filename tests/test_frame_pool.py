@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+import frame_pool
+from manim import Create, Rotate, Scene, Square, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+
+class RotatingSquare(Scene):
+    def construct(self):
+        square = Square()
+        self.play(Create(square), run_time=0.5)
+        self.play(Rotate(square, angle=1.0), run_time=0.5)
+
+
+def render_frames(monkeypatch):
+    frames = []
+    monkeypatch.setattr(CairoRenderer, "add_frame",
+                        lambda self, frame, num_frames=1: frames.append(np.array(frame)))
+    options = {"pixel_width": 320, "pixel_height": 180, "frame_rate": 15, "write_to_movie": False,
+               "disable_caching": True, "progress_bar": "none", "preview": False}
+    with tempconfig(options):
+        RotatingSquare().render()
+    return frames
+
+
+def test_parallel_play_matches_serial(monkeypatch):
+    serial = render_frames(monkeypatch)
+
+    monkeypatch.setenv("MATHIATION_FRAME_WORKERS", "2")
+    monkeypatch.setattr(Scene, "play_internal", Scene.play_internal)
+    frame_pool.install()
+    forked = []
+    original = frame_pool.render_frames
+    monkeypatch.setattr(frame_pool, "render_frames",
+                        lambda scene, times, n: (forked.append(len(times)), original(scene, times, n)))
+    parallel = render_frames(monkeypatch)
+
+    assert forked, "no play went through the frame workers"
+    assert len(parallel) == len(serial)
+    for a, b in zip(serial, parallel):
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,35 @@
+import ast
+import textwrap
+
+import scene_index
+
+SOURCE = textwrap.dedent('''
+    class Steps(Scene):
+        def construct(self):
+            steps = ["a", "b", "c"]
+
+            def add_step(i):
+                self.play(Write(steps[i]))
+                self.wait()
+
+            for i in range(len(steps)):
+                add_step(i)
+            self.outro()
+
+        def outro(self):
+            self.clear()
+            self.play(FadeIn(Text("done")))
+''')
+
+
+def test_counts_follow_helpers_and_literal_lengths():
+    (node,) = scene_index._scene_nodes(ast.parse(SOURCE))
+    assert scene_index.count_scene_calls(node) == {"play": 4, "wait": 3, "clear": 1}
+
+
+def test_duplicate_scene_names_are_reported():
+    manifest = {"files": {
+        "a.py": {"scenes": [{"name": "Intro"}, {"name": "Only"}]},
+        "b.py": {"scenes": [{"name": "Intro"}]},
+    }}
+    assert scene_index.duplicate_scene_names(manifest) == {"Intro": ["a.py", "b.py"]}
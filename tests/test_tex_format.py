@@ -0,0 +1,83 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import tex_format
+
+DOCUMENT = (
+    "\\documentclass[preview]{standalone}\n\\usepackage{amsmath}\n"
+    "\\begin{document}\n$x$\n\\end{document}\n"
+)
+
+
+@pytest.fixture
+def format_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MATHIATION_TEX_FORMAT_DIR", str(tmp_path))
+    monkeypatch.setattr(tex_format, "_formats", {})
+    return tmp_path
+
+
+def test_format_name_follows_preamble_and_compiler():
+    preamble = tex_format.preamble_of(DOCUMENT)
+    name = tex_format.format_name(preamble, "latex")
+    assert tex_format.format_name(preamble, "latex") == name
+    assert tex_format.format_name(preamble + "\\usepackage{amssymb}\n", "latex") != name
+    assert tex_format.format_name(preamble, "pdflatex") != name
+
+
+def test_unsupported_compiler_gets_no_format(format_dir, monkeypatch):
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: pytest.fail("should not build"))
+    assert tex_format.ensure_format(tex_format.preamble_of(DOCUMENT), "xelatex") is None
+
+
+def test_failed_build_gets_no_format(format_dir, monkeypatch):
+    def run(command, cwd, **kwargs):
+        raise subprocess.CalledProcessError(1, command)
+
+    monkeypatch.setattr(subprocess, "run", run)
+    assert tex_format.ensure_format(tex_format.preamble_of(DOCUMENT), "latex") is None
+    assert list(format_dir.iterdir()) == []
+
+
+def test_build_without_fmt_output_gets_no_format(format_dir, monkeypatch):
+    monkeypatch.setattr(subprocess, "run", lambda command, cwd, **kwargs: None)
+    assert tex_format.ensure_format(tex_format.preamble_of(DOCUMENT), "latex") is None
+
+
+def test_build_dumps_at_begin_document_and_moves_fmt_into_place(format_dir, monkeypatch):
+    preamble = tex_format.preamble_of(DOCUMENT)
+    name = tex_format.format_name(preamble, "latex")
+
+    def run(command, cwd, **kwargs):
+        source = (Path(cwd) / f"{name}.tex").read_text(encoding="utf-8")
+        assert source.startswith(preamble)
+        assert "\\begin{document}" in source[len(preamble):]
+        (Path(cwd) / f"{name}.fmt").write_bytes(b"fmt")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    assert tex_format.ensure_format(preamble, "latex") == format_dir / name
+    # Only the finished format is left behind, no build dir
+    assert [p.name for p in format_dir.iterdir()] == [f"{name}.fmt"]
+
+
+@pytest.mark.parametrize("command, expected", [
+    (["latex", "-interaction=batchmode", "x.tex"],
+     ["latex", "-fmt=/fmt/mathtex-1", "-interaction=batchmode", "x.tex"]),
+    ('latex -interaction=batchmode "x.tex"',
+     'latex -fmt="/fmt/mathtex-1" -interaction=batchmode "x.tex"'),
+])
+def test_compile_command_loads_the_format(tmp_path, monkeypatch, command, expected):
+    tex_file = tmp_path / "x.tex"
+    tex_file.write_text(DOCUMENT, encoding="utf-8")
+    monkeypatch.setattr(tex_format, "_original_make_command", lambda *args: command)
+    monkeypatch.setattr(tex_format, "ensure_format", lambda preamble, compiler: Path("/fmt/mathtex-1"))
+    assert tex_format.make_tex_compilation_command("latex", ".dvi", tex_file, tmp_path) == expected
+
+
+def test_compile_command_unchanged_without_format(tmp_path, monkeypatch):
+    tex_file = tmp_path / "x.tex"
+    tex_file.write_text(DOCUMENT, encoding="utf-8")
+    command = ["xelatex", "-no-pdf", "x.tex"]
+    monkeypatch.setattr(tex_format, "_original_make_command", lambda *args: command)
+    assert tex_format.make_tex_compilation_command("xelatex", ".xdv", tex_file, tmp_path) == command
@@ -0,0 +1,247 @@
+# Shared, size-bounded TeX -> SVG cache for all scenes.
+#
+# Manim already caches compiled TeX per media dir, but every checkout / render
+# box keeps its own copy and nothing ever gets evicted. This cache is keyed by
+# the content that actually decides the SVG (TeX source, environment and the
+# full template incl. compiler), lives in one directory that every scene and
+# worker process can share, keeps the total size under a disk budget with LRU
+# eviction, and records hits / misses / bytes / compile time saved.
+#
+# Scenes pick it up through cache_setup.install_caches(). Configure with:
+#     MATHIATION_TEX_CACHE      cache directory (default ~/.cache/mathiation/tex)
+#     MATHIATION_TEX_CACHE_MB   disk budget in MB (default 512)
+#
+# Usage:
+#     python tex_cache.py stats
+#     python tex_cache.py prune [--max-mb N]
+#     python tex_cache.py clear
+
+import argparse
+import hashlib
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+
+DEFAULT_DIR = Path.home() / ".cache" / "mathiation" / "tex"
+DEFAULT_MAX_MB = 512
+
+_original_tex_to_svg_file = None
+
+
+def cache_dir():
+    return Path(os.environ.get("MATHIATION_TEX_CACHE", DEFAULT_DIR))
+
+
+def max_bytes():
+    return int(float(os.environ.get("MATHIATION_TEX_CACHE_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+
+
+def cache_key(expression, environment, tex_template):
+    h = hashlib.sha256()
+    for part in (expression, environment or "", tex_template.body,
+                 tex_template.tex_compiler, tex_template.output_format):
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class TexCache:
+    def __init__(self, directory=None, budget=None):
+        self.directory = Path(directory) if directory is not None else cache_dir()
+        self.budget = max_bytes() if budget is None else budget
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.directory / "index.sqlite", timeout=30)
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                compile_seconds REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS stats (
+                name TEXT PRIMARY KEY,
+                value REAL NOT NULL
+            );
+            """
+        )
+        self.db.commit()
+
+    def path(self, key):
+        return self.directory / f"{key}.svg"
+
+    def _bump(self, **counters):
+        for name, value in counters.items():
+            self.db.execute(
+                "INSERT INTO stats(name, value) VALUES(?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, value),
+            )
+
+    def contains(self, key):
+        """Membership test that leaves LRU order and stats alone."""
+        row = self.db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None and self.path(key).exists()
+
+    def get(self, key):
+        """Return the cached SVG path for ``key`` or None, updating LRU and stats."""
+        row = self.db.execute(
+            "SELECT size, compile_seconds FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        path = self.path(key)
+        if row is None or not path.exists():
+            self._bump(misses=1)
+            self.db.commit()
+            return None
+        size, seconds = row
+        self.db.execute(
+            "UPDATE entries SET last_used = ?, hits = hits + 1 WHERE key = ?",
+            (time.time(), key),
+        )
+        self._bump(hits=1, bytes_served=size, seconds_saved=seconds)
+        self.db.commit()
+        return path
+
+    def put(self, key, svg_file, compile_seconds):
+        path = self.path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(svg_file, tmp)
+        os.replace(tmp, path)  # atomic, so concurrent workers never see half a file
+        size = path.stat().st_size
+        self.db.execute(
+            "INSERT OR REPLACE INTO entries(key, size, last_used, hits, compile_seconds) "
+            "VALUES(?, ?, ?, 0, ?)",
+            (key, size, time.time(), compile_seconds),
+        )
+        self._bump(bytes_written=size)
+        self.db.commit()
+        self.evict()
+        return path
+
+    def evict(self, budget=None):
+        """Drop least recently used entries until the cache fits the budget."""
+        budget = self.budget if budget is None else budget
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= budget:
+            return 0
+        evicted = 0
+        for key, size in self.db.execute(
+            "SELECT key, size FROM entries ORDER BY last_used ASC"
+        ).fetchall():
+            if total <= budget:
+                break
+            self.path(key).unlink(missing_ok=True)
+            self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self._bump(evictions=evicted)
+        self.db.commit()
+        return evicted
+
+    def clear(self):
+        for (key,) in self.db.execute("SELECT key FROM entries").fetchall():
+            self.path(key).unlink(missing_ok=True)
+        self.db.execute("DELETE FROM entries")
+        self.db.execute("DELETE FROM stats")
+        self.db.commit()
+
+    def stats(self):
+        counters = dict(self.db.execute("SELECT name, value FROM stats").fetchall())
+        entries, total = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "bytes": total,
+            "budget": self.budget,
+            "hits": int(hits),
+            "misses": int(misses),
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "bytes_served": int(counters.get("bytes_served", 0)),
+            "bytes_written": int(counters.get("bytes_written", 0)),
+            "seconds_saved": counters.get("seconds_saved", 0.0),
+            "evictions": int(counters.get("evictions", 0)),
+        }
+
+
+_cache = None
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        _cache = TexCache()
+    return _cache
+
+
+def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    """Drop-in replacement for manim's tex_to_svg_file backed by the shared cache."""
+    from manim import config
+
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    cache = get_cache()
+    key = cache_key(expression, environment, tex_template)
+    path = cache.get(key)
+    if path is not None:
+        return path
+
+    start = time.perf_counter()
+    svg_file = _original_tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+    return cache.put(key, svg_file, time.perf_counter() - start)
+
+
+def is_installed():
+    from manim.mobject.text import tex_mobject
+
+    return tex_mobject.tex_to_svg_file is cached_tex_to_svg_file
+
+
+def install():
+    """Route MathTex / Tex compilation through the shared cache (idempotent)."""
+    global _original_tex_to_svg_file
+    from manim.mobject.text import tex_mobject
+
+    if is_installed():
+        return
+    _original_tex_to_svg_file = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+
+
+def print_stats(stats):
+    mb = 1024 * 1024
+    print(f"Entries:        {stats['entries']}")
+    print(f"Size:           {stats['bytes'] / mb:.1f} / {stats['budget'] / mb:.0f} MB")
+    print(f"Hits / misses:  {stats['hits']} / {stats['misses']} ({stats['hit_rate']:.1%} hit rate)")
+    print(f"Bytes served:   {stats['bytes_served'] / mb:.1f} MB")
+    print(f"Bytes written:  {stats['bytes_written'] / mb:.1f} MB")
+    print(f"Time saved:     {stats['seconds_saved']:.1f} s")
+    print(f"Evictions:      {stats['evictions']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or maintain the shared TeX cache.")
+    parser.add_argument("command", choices=["stats", "prune", "clear"])
+    parser.add_argument("--max-mb", type=float, default=None, help="budget for prune")
+    args = parser.parse_args()
+
+    cache = get_cache()
+    if args.command == "stats":
+        print(f"Cache dir:      {cache.directory}")
+        print_stats(cache.stats())
+    elif args.command == "prune":
+        budget = None if args.max_mb is None else int(args.max_mb * 1024 * 1024)
+        print(f"Evicted {cache.evict(budget)} entries")
+    else:
+        cache.clear()
+        print("Cache cleared")
+
+
+if __name__ == "__main__":
+    main()
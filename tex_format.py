@@ -0,0 +1,138 @@
+# Precompiled TeX format (dumped preamble) for the MathTex template.
+#
+# Every MathTex compile re-reads amsmath and the rest of the template
+# preamble from scratch. This module dumps that preamble once into a .fmt
+# file with mylatexformat and makes Manim's latex calls load it with -fmt, so
+# each compile starts with the packages already in memory. The format is named
+# after a hash of the preamble and compiler, so changing the template simply
+# builds a new one on the next run.
+#
+# Scenes pick it up through cache_setup.install_caches() when
+# MATHIATION_TEX_FORMAT=1. Formats live in MATHIATION_TEX_FORMAT_DIR
+# (default ~/.cache/mathiation/fmt).
+#
+# Usage:
+#     python tex_format.py   # build (or rebuild) the format for the default template
+
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+DEFAULT_DIR = Path.home() / ".cache" / "mathiation" / "fmt"
+# Formats for engines that load system fonts at runtime don't dump reliably
+SUPPORTED_COMPILERS = ("latex", "pdflatex")
+
+# Manim's own logger, without importing Manim
+logger = logging.getLogger("manim")
+
+_original_make_command = None
+_formats = {}  # preamble hash -> format path, or None if the build failed
+
+
+def enabled():
+    return os.environ.get("MATHIATION_TEX_FORMAT", "") not in ("", "0")
+
+
+def format_dir():
+    return Path(os.environ.get("MATHIATION_TEX_FORMAT_DIR", DEFAULT_DIR))
+
+
+def preamble_of(tex_code):
+    return tex_code.partition("\\begin{document}")[0]
+
+
+def format_name(preamble, compiler):
+    h = hashlib.sha256()
+    h.update(compiler.encode("utf-8"))
+    h.update(b"\0")
+    h.update(preamble.encode("utf-8"))
+    return f"mathtex-{h.hexdigest()[:16]}"
+
+
+def write_format_source(path, preamble):
+    # mylatexformat dumps when it reaches \begin{document}; without it the
+    # -ini run just hits end of file and fails
+    Path(path).write_text(preamble + "\\begin{document}\\end{document}\n", encoding="utf-8")
+
+
+def ensure_format(preamble, compiler):
+    """Return the path (without .fmt) of the dumped format, building it if needed."""
+    if compiler not in SUPPORTED_COMPILERS:
+        return None
+    name = format_name(preamble, compiler)
+    if name in _formats:
+        return _formats[name]
+
+    directory = format_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    fmt_file = directory / f"{name}.fmt"
+    if not fmt_file.exists():
+        # Build in a private dir and move the finished .fmt into place, so
+        # workers racing on the same format never share or read a partial file
+        work = Path(tempfile.mkdtemp(prefix=f"{name}.", dir=directory))
+        try:
+            write_format_source(work / f"{name}.tex", preamble)
+            command = [compiler, "-ini", "-interaction=batchmode", "-halt-on-error",
+                       f"-jobname={name}", f"&{compiler}", "mylatexformat.ltx", f"{name}.tex"]
+            try:
+                subprocess.run(command, cwd=work, check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except (OSError, subprocess.CalledProcessError) as exc:
+                logger.warning(f"tex_format: could not dump {name}.fmt ({exc}), compiling without it")
+                _formats[name] = None
+                return None
+            if not (work / f"{name}.fmt").exists():
+                logger.warning(f"tex_format: {compiler} produced no {name}.fmt, compiling without it")
+                _formats[name] = None
+                return None
+            os.replace(work / f"{name}.fmt", fmt_file)
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+        logger.info(f"tex_format: built {fmt_file}")
+
+    _formats[name] = directory / name
+    return _formats[name]
+
+
+def make_tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
+    """Manim's compile command with -fmt pointing at the dumped preamble."""
+    command = _original_make_command(tex_compiler, output_format, tex_file, tex_dir)
+    # Keyed on the file's own preamble, so a custom per-mobject template gets
+    # its own format instead of a mismatched one
+    preamble = preamble_of(Path(tex_file).read_text(encoding="utf-8"))
+    fmt = ensure_format(preamble, tex_compiler)
+    if fmt is None:
+        return command
+    # Older Manim builds a shell string, newer an argument list
+    if isinstance(command, str):
+        return command.replace(tex_compiler, f'{tex_compiler} -fmt="{fmt}"', 1)
+    return [command[0], f"-fmt={fmt}", *command[1:]]
+
+
+def install():
+    """Compile MathTex against the dumped format (idempotent)."""
+    global _original_make_command
+    from manim.utils import tex_file_writing
+
+    if tex_file_writing.make_tex_compilation_command is make_tex_compilation_command:
+        return
+    _original_make_command = tex_file_writing.make_tex_compilation_command
+    tex_file_writing.make_tex_compilation_command = make_tex_compilation_command
+
+
+def main():
+    from manim import config
+
+    tex_template = config["tex_template"]
+    path = ensure_format(preamble_of(tex_template.body), tex_template.tex_compiler)
+    if path is None:
+        raise SystemExit("Format not built (unsupported compiler or mylatexformat missing)")
+    print(f"Format ready: {path}.fmt")
+
+
+if __name__ == "__main__":
+    main()
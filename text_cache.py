@@ -0,0 +1,113 @@
+# Persistent Pango layout / glyph cache for Text.
+#
+# Every scene ends on the same "Nailed it!" card, and titles like
+# "Schwarzschild Radius 🌑" make Pango walk the font fallback chain for the
+# emoji on every run. Manim's own text_dir cache is keyed with the colour
+# baked in and lives per media dir, so a yellow and a white copy of the same
+# string are laid out twice. This cache lays each string out once in a
+# canonical colour, keyed by text, font, size and every other style setting
+# except colour, and later builds recolour the cached SVG instead of calling
+# Pango again. The glyph outlines of that SVG are then picked up by
+# svg_cache like any other SVG.
+#
+# Text with per-substring colours or gradients (t2c, t2g, gradient) bakes
+# colour into the layout and goes through Manim unchanged.
+#
+# Scenes pick it up through cache_setup.install_caches(). Configure with:
+#     MATHIATION_TEXT_CACHE   cache directory (default ~/.cache/mathiation/text)
+#
+# Usage:
+#     python text_cache.py stats
+#     python text_cache.py clear
+
+import argparse
+import os
+import re
+import shutil
+from pathlib import Path
+
+DEFAULT_DIR = Path.home() / ".cache" / "mathiation" / "text"
+CANONICAL_COLOR = "#FFFFFF"
+RGB_PATTERN = re.compile(r"rgb\([^)]*\)")
+
+_original_text2svg = None
+
+
+def cache_dir():
+    return Path(os.environ.get("MATHIATION_TEXT_CACHE", DEFAULT_DIR))
+
+
+def is_cacheable(text_mob):
+    return not (text_mob.t2c or text_mob.t2g or text_mob.gradient)
+
+
+def recolor_svg(source, target, color):
+    """Copy ``source`` to ``target`` with every fill/stroke colour set to ``color``."""
+    from manim import ManimColor
+
+    r, g, b = ManimColor(color).to_rgb()
+    rgb = f"rgb({r * 100:g}%,{g * 100:g}%,{b * 100:g}%)"
+    svg = Path(source).read_text(encoding="utf-8")
+    tmp = Path(target).with_name(f"{Path(target).name}.{os.getpid()}.tmp")
+    tmp.write_text(RGB_PATTERN.sub(rgb, svg), encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def cached_text2svg(self, color):
+    from manim import config
+
+    if not is_cacheable(self):
+        return _original_text2svg(self, color)
+
+    text_dir = Path(config.get_dir("text_dir"))
+    target = text_dir / f"{self._text2hash(color)}.svg"
+    if target.exists():
+        return str(target)
+
+    # Hashing the canonical colour leaves exactly the colour-independent style
+    key = self._text2hash(CANONICAL_COLOR)
+    directory = cache_dir()
+    cached = directory / f"{key}.svg"
+    if not cached.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        layout = _original_text2svg(self, CANONICAL_COLOR)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        shutil.copyfile(layout, tmp)
+        os.replace(tmp, cached)
+
+    text_dir.mkdir(parents=True, exist_ok=True)
+    recolor_svg(cached, target, color)
+    return str(target)
+
+
+def install():
+    """Build cacheable Text objects from the shared layout cache (idempotent)."""
+    global _original_text2svg
+    from manim import Text
+
+    if Text._text2svg is cached_text2svg:
+        return
+    _original_text2svg = Text._text2svg
+    Text._text2svg = cached_text2svg
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the Text layout cache.")
+    parser.add_argument("command", choices=["stats", "clear"])
+    args = parser.parse_args()
+
+    directory = cache_dir()
+    files = list(directory.glob("*.svg")) if directory.exists() else []
+    if args.command == "stats":
+        size = sum(f.stat().st_size for f in files)
+        print(f"Cache dir: {directory}")
+        print(f"Layouts:   {len(files)}")
+        print(f"Size:      {size / (1024 * 1024):.1f} MB")
+    else:
+        for f in files:
+            f.unlink()
+        print("Cache cleared")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Many lines of Text from one Pango layout call.
+#
+# Text-heavy pages (the Yang-Mills explanations, the symbol legends in the
+# pendulum and light-clock scenes) used to build one Text per line, which
+# means one Pango layout and one SVG round-trip per line. TextLines hands out
+# empty placeholders while the scene describes its lines, then build() lays
+# out all lines of the same font size as a single multi-line Text and moves
+# each line's glyphs into its placeholder. Placeholders can be used anywhere a
+# Text could (VGroup, arrange, StepScroller), one submobject per line.
+#
+# Usage:
+#     lines = TextLines()
+#     explanations = VGroup(
+#         lines("L = distance between mirrors", font_size=28, color=BLUE),
+#         lines("c = speed of light", font_size=28, color=YELLOW),
+#     )
+#     lines.build()
+#     explanations.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+
+from manim import *
+
+
+class TextLines:
+    def __init__(self, **text_kwargs):
+        # Shared Text options (font, weight, ...); ligatures stay off so every
+        # character maps to exactly one submobject and lines can be sliced out
+        self.text_kwargs = {**text_kwargs, "disable_ligatures": True}
+        self.entries = []  # (text, font_size, color, placeholder)
+
+    def __call__(self, text, font_size=DEFAULT_FONT_SIZE, color=WHITE):
+        if "\n" in text:
+            raise ValueError("TextLines entries are single lines; add one entry per line")
+        placeholder = VGroup()
+        self.entries.append((text, font_size, color, placeholder))
+        return placeholder
+
+    def build(self):
+        """Lay out every pending line, one Pango call per font size."""
+        by_size = {}
+        for entry in self.entries:
+            by_size.setdefault(entry[1], []).append(entry)
+
+        for font_size, entries in by_size.items():
+            joined = "\n".join(text for text, _, _, _ in entries)
+            block = Text(joined, font_size=font_size, **self.text_kwargs)
+            chars = block.submobjects
+            if len(chars) != len(joined):
+                # Multi-codepoint glyphs (some emoji) break the one char, one
+                # submobject mapping; lay those lines out one by one instead
+                chars = None
+
+            start = 0
+            for text, _, color, placeholder in entries:
+                if chars is None:
+                    placeholder.add(*Text(text, font_size=font_size, **self.text_kwargs))
+                else:
+                    placeholder.add(*chars[start:start + len(text)])
+                    start += len(text) + 1  # skip the newline
+                placeholder.set_color(color)
+                placeholder.move_to(ORIGIN)
+
+        self.entries = []
+        return self
@@ -1,5 +1,9 @@
 from manim import *
 import numpy as np
+from step_scroller import StepScroller
+from text_lines import TextLines
+from kinematics import Kinematics, bounce, lorentz_gamma
+from cache_setup import install_caches
 
 # TikTok portrait
 config.pixel_width = 1080
@@ -8,6 +12,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class LightClockTimeDilation(Scene):
     def construct(self):
         # -----------------------------
@@ -46,13 +52,16 @@ class LightClockTimeDilation(Scene):
         text_width = config.frame_width - left_pad - right_pad
 
         # Explanations of symbols
+        lines = TextLines()
         explanations = VGroup(
-            Text("L = distance between mirrors", font_size=28, color=BLUE),
-            Text("Δt₀ = proper time (stationary clock)", font_size=28, color=GREEN),
-            Text("Δt = dilated time (moving clock)", font_size=28, color=ORANGE),
-            Text("v = speed of moving clock", font_size=28, color=RED),
-            Text("c = speed of light", font_size=28, color=YELLOW)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+            lines("L = distance between mirrors", font_size=28, color=BLUE),
+            lines("Δt₀ = proper time (stationary clock)", font_size=28, color=GREEN),
+            lines("Δt = dilated time (moving clock)", font_size=28, color=ORANGE),
+            lines("v = speed of moving clock", font_size=28, color=RED),
+            lines("c = speed of light", font_size=28, color=YELLOW)
+        )
+        lines.build()
+        explanations.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         explanations.set_width(text_width)
         explanations.to_edge(UP, buff=top_padding)
         self.play(Write(explanations))
@@ -75,8 +84,7 @@ class LightClockTimeDilation(Scene):
         floor_m = Line(RIGHT*1 + DOWN*1, RIGHT*1 + RIGHT*clock_width + DOWN*1, color=RED)
         ceiling_m = Line(RIGHT*1 + UP*1, RIGHT*1 + RIGHT*clock_width + UP*1, color=RED)
         clock_m = VGroup(floor_m, ceiling_m)
-        # Start photon 1.0 left from current
-        photon_m = Dot(color=YELLOW).move_to(floor_m.get_center() - RIGHT*1 + UP*0.05)
+        photon_m = Dot(color=YELLOW).move_to(floor_m.get_center() + UP*0.05)
         label_m = Text("Moving\nΔt", font_size=24, color=RED).next_to(floor_m, DOWN, buff=vertical_spacing)
 
         # Labels for L
@@ -89,46 +97,35 @@ class LightClockTimeDilation(Scene):
         # -----------------------------
         # Animate photon bouncing naturally
         # -----------------------------
-        total_frames = 250
-        photon_speed_s = 0.05
-        photon_speed_m = 0.03  # slower for moving clock to show time dilation
-        photon_dir_s = 1
-        photon_dir_m = 1
-
-        clock_start = RIGHT*1
-        clock_end = RIGHT*3
-
-        for alpha in np.linspace(0, 1, total_frames):
-            # Move moving clock horizontally
-            new_center = clock_start + alpha * (clock_end - clock_start)
-            dx = new_center - clock_m.get_center()
-            clock_m.shift(dx)
-
-            # Stationary photon vertical bounce
-            top_s = ceiling_s.get_center()[1]
-            bottom_s = floor_s.get_center()[1]
-            photon_y_s = photon_s.get_center()[1] + photon_dir_s * photon_speed_s
-            if photon_y_s >= top_s:
-                photon_y_s = top_s
-                photon_dir_s *= -1
-            elif photon_y_s <= bottom_s:
-                photon_y_s = bottom_s
-                photon_dir_s *= -1
-            photon_s.move_to(np.array([photon_s.get_center()[0], photon_y_s, 0]))
-
-            # Moving photon diagonal bounce (slower)
-            top_m = ceiling_m.get_center()[1]
-            bottom_m = floor_m.get_center()[1]
-            photon_y_m = photon_m.get_center()[1] + photon_dir_m * photon_speed_m
-            if photon_y_m >= top_m:
-                photon_y_m = top_m
-                photon_dir_m *= -1
-            elif photon_y_m <= bottom_m:
-                photon_y_m = bottom_m
-                photon_dir_m *= -1
-            photon_m.move_to(np.array([photon_m.get_center()[0] + 0.01, photon_y_m, 0]))
-
-            self.wait(0.02)
+        # Both photons travel at c. Inside the moving clock the photon also
+        # keeps the clock's horizontal speed v = βc, so it only climbs at c/γ:
+        # that is the dilation. The clock drives to the right edge of the frame
+        # over the 5 s, and β = 0.4 sets c from that: slow enough on screen
+        # that the slower moving photon still reaches its mirror and turns back.
+        duration = 5.0
+        beta = 0.4
+        clock_start = clock_m.get_center()
+        v = (config.frame_width / 2 - clock_m.get_right()[0]) / duration
+        c = v / beta
+        # Dots sit just off the mirrors instead of on the lines
+        bottom = floor_s.get_center()[1] + 0.05
+        top = ceiling_s.get_center()[1] - 0.05
+        photon_x_s = photon_s.get_center()[0]
+
+        def clock_m_path(t):
+            return clock_start + RIGHT * v * t
+
+        def photon_s_path(t):
+            return np.array([photon_x_s, bounce(t, c, bottom, top), 0])
+
+        def photon_m_path(t):
+            return np.array([clock_m_path(t)[0], bounce(t, c / lorentz_gamma(beta), bottom, top), 0])
+
+        self.play(Kinematics([
+            (clock_m, clock_m_path),
+            (photon_s, photon_s_path),
+            (photon_m, photon_m_path),
+        ], run_time=duration))
 
         #self.wait(1)
         self.play(FadeOut(clock_m), FadeOut(photon_m), FadeOut(label_m))
@@ -142,8 +139,7 @@ class LightClockTimeDilation(Scene):
         left_padding = 1.5
         right_padding = 0.3
         text_width = config.frame_width - left_padding - right_padding
-        start_y = config.frame_height / 4
-        steps_group = VGroup()
+        scroller = StepScroller(self, max_width=text_width)
 
         def create_stickman(center_point):
             head_radius = 0.15
@@ -161,13 +157,8 @@ class LightClockTimeDilation(Scene):
             leg_right = Line(body_bottom, body_bottom + RIGHT*leg_length + DOWN*0.4, color=YELLOW)
             return VGroup(head, body, arm_left, arm_right, leg_left, leg_right)
 
-        def add_step(step_mob):
-            step_mob.set_width(min(step_mob.width, text_width))
-            steps_group.add(step_mob)
-            if len(steps_group) == 1:
-                step_mob.move_to(UP * start_y)
-            else:
-                step_mob.next_to(steps_group[-2], DOWN, buff=0.7)
+        def add_step(index):
+            step_mob = scroller.items[index]
 
             stickman = create_stickman(step_mob.get_bottom() + DOWN*0.4)
             self.add(stickman)
@@ -187,15 +178,7 @@ class LightClockTimeDilation(Scene):
             )
             self.remove(stickman, pointer)
 
-            if len(steps_group) > 4:
-                prev_step = steps_group[-5]
-                shift_amount = prev_step.height + 0.7
-                self.play(
-                    steps_group.animate.shift(UP * shift_amount),
-                    run_time=0.5,
-                    rate_func=smooth
-                )
-            else:
+            if not scroller.scroll(index):
                 self.wait(0.5)
 
         # Steps in simple words with Pythagorean triangle
@@ -220,8 +203,9 @@ class LightClockTimeDilation(Scene):
             MathTex(r"\Delta t = \frac{\Delta t_0}{\sqrt{1 - v^2/c^2}} = \gamma \Delta t_0", font_size=40, color=BLUE),
         ]
 
-        for step in steps_list:
-            add_step(step)
+        scroller.layout(steps_list)
+        for i in range(len(steps_list)):
+            add_step(i)
 
         self.wait(1.5)
         # Closing
@@ -1,5 +1,9 @@
 from manim import *
 import numpy as np
+from plotting import coords_to_points, evaluate, segmented_plot
+from dot_cloud import DotCloud
+from stagger import StaggeredOpacity
+from cache_setup import install_caches
 
 # Configure TikTok portrait resolution
 config.pixel_width = 1080
@@ -8,6 +12,8 @@ config.frame_width = 6
 config.frame_height = 6 * (1920 / 1080)
 config.background_color = BLACK
 
+install_caches(__file__)
+
 class PairedTrigGraphs(Scene):
     def construct(self):
         # -------- Title clip --------
@@ -98,17 +104,15 @@ class PairedTrigGraphs(Scene):
                 text.next_to(axes.c2p(0, y), LEFT*0.25)
                 labels.add(text)
 
-            for l in labels:
-                l.set_opacity(0)
-                self.add(l)
-                self.play(l.animate.set_opacity(1), run_time=0.05)
+            # One label every 0.05 s, as a single animation
+            self.play(StaggeredOpacity(labels, lag_ratio=1), run_time=0.05 * len(labels))
             return labels
 
         add_axis_labels(axes1, y_range1)
         add_axis_labels(axes2, y_range2)
 
-        graph1 = self.safe_plot(axes1, fn1, x_min, x_max, y_range1[1])
-        graph2 = self.safe_plot(axes2, fn2, x_min, x_max, y_range2[1])
+        graph1 = segmented_plot(axes1, fn1, x_min, x_max, y_range1[1])
+        graph2 = segmented_plot(axes2, fn2, x_min, x_max, y_range2[1])
         self.play(Create(graph1), Create(graph2), run_time=2)
 
         dots1 = self.create_dots(axes1, fn1, x_vals, y_range1[1])
@@ -120,22 +124,14 @@ class PairedTrigGraphs(Scene):
         def update_dots1(mob, dt):
             nonlocal shift1
             shift1 += speed*dt
-            for i, dot in enumerate(mob):
-                new_x = ((x_vals[i]+shift1 - x_min) % (x_max-x_min)) + x_min
-                y = fn1(new_x)
-                if not np.isfinite(y) or abs(y) > y_range1[1]:
-                    y = np.sign(y)*y_range1[1]
-                dot.move_to(axes1.c2p(new_x, y))
+            new_x = ((x_vals+shift1 - x_min) % (x_max-x_min)) + x_min
+            mob.set_positions(self.dot_points(axes1, fn1, new_x, y_range1[1]))
 
         def update_dots2(mob, dt):
             nonlocal shift2
             shift2 += speed*dt
-            for i, dot in enumerate(mob):
-                new_x = ((x_vals[i]+shift2 - x_min) % (x_max-x_min)) + x_min
-                y = fn2(new_x)
-                if not np.isfinite(y) or abs(y) > y_range2[1]:
-                    y = np.sign(y)*y_range2[1]
-                dot.move_to(axes2.c2p(new_x, y))
+            new_x = ((x_vals+shift2 - x_min) % (x_max-x_min)) + x_min
+            mob.set_positions(self.dot_points(axes2, fn2, new_x, y_range2[1]))
 
         dots1.add_updater(update_dots1)
         dots2.add_updater(update_dots2)
@@ -145,35 +141,10 @@ class PairedTrigGraphs(Scene):
         dots2.clear_updaters()
 
     def create_dots(self, axes, fn, x_vals, y_clip):
-        dots = VGroup()
-        for x in x_vals:
-            y = fn(x)
-            if not np.isfinite(y) or abs(y) > y_clip:
-                y = np.sign(y)*y_clip
-            dot = Dot(axes.c2p(x, y), radius=0.04, color=YELLOW)
-            dots.add(dot)
-        return dots
-
-    def safe_plot(self, axes, fn, x_min, x_max, threshold=2):
-        group = VGroup()
-        xs = np.arange(x_min, x_max, 0.005)
-        seg = []
-        for x in xs:
-            y = fn(x)
-            if not np.isfinite(y) or abs(y) > threshold:
-                if len(seg) > 1:
-                    pts = [axes.c2p(xx, max(min(fn(xx), threshold), -threshold)) for xx in seg]
-                    curve = VMobject()
-                    curve.set_points_as_corners(pts)
-                    curve.set_stroke(color=BLUE, width=3)
-                    group.add(curve)
-                seg = []
-            else:
-                seg.append(x)
-        if len(seg) > 1:
-            pts = [axes.c2p(xx, max(min(fn(xx), threshold), -threshold)) for xx in seg]
-            curve = VMobject()
-            curve.set_points_as_corners(pts)
-            curve.set_stroke(color=BLUE, width=3)
-            group.add(curve)
-        return group
+        return DotCloud(self.dot_points(axes, fn, x_vals, y_clip), radius=0.04, color=YELLOW)
+
+    def dot_points(self, axes, fn, x_vals, y_clip):
+        # Poles and values beyond the axes stick to the top/bottom edge
+        y = evaluate(fn, x_vals)
+        y = np.clip(np.nan_to_num(y, nan=0.0, posinf=y_clip, neginf=-y_clip), -y_clip, y_clip)
+        return coords_to_points(axes, x_vals, y)